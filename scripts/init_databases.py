@@ -302,5 +302,10 @@ def parse_args() -> argparse.Namespace:
 
 if __name__ == "__main__":
     args = parse_args()
-    exit_code = asyncio.run(main(args))
+    if sys.platform != "win32":
+        import uvloop
+
+        exit_code = uvloop.run(main(args))
+    else:
+        exit_code = asyncio.run(main(args))
     sys.exit(exit_code)
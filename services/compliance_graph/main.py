@@ -22,6 +22,7 @@ from services.compliance_graph.routes import (
     paths,
 )
 from shared.config import settings
+from shared.database.health import health_check_all, warm_up_all
 from shared.database.neo4j import Neo4jClient
 from shared.database.redis import RedisClient
 from shared.logging import get_logger, setup_logging
@@ -57,6 +58,9 @@ async def lifespan(app: FastAPI) -> Any:
         RedisClient.get_client()
         logger.info("redis_connected")
 
+        # Open pool connections before serving traffic
+        await warm_up_all({"neo4j": Neo4jClient.warm_up, "redis": RedisClient.warm_up})
+
     except Exception as e:
         logger.error("startup_failed", error=str(e))
         raise
@@ -101,15 +105,13 @@ async def health_check() -> HealthResponse:
 
     Returns health status of the service and its dependencies.
     """
-    components: dict[str, dict[str, Any]] = {}
-
-    # Check Neo4j
-    neo4j_health = await Neo4jClient.health_check()
-    components["neo4j"] = neo4j_health
-
-    # Check Redis
-    redis_health = await RedisClient.health_check()
-    components["redis"] = redis_health
+    # Check dependencies concurrently
+    components = await health_check_all(
+        {
+            "neo4j": Neo4jClient.health_check,
+            "redis": RedisClient.health_check,
+        }
+    )
 
     # Determine overall status
     all_healthy = all(c.get("status") == "healthy" for c in components.values())
@@ -126,7 +126,7 @@ class PathFinder:
         ORDER BY depth
         """
 
-        results = await Neo4jClient.run_query(
+        results = await Neo4jClient.run_read_query(
             query,
             {"req_id": requirement_id, "max_depth": max_depth},
         )
@@ -158,7 +158,7 @@ class PathFinder:
         LIMIT 1
         """
 
-        cycle_results = await Neo4jClient.run_query(
+        cycle_results = await Neo4jClient.run_read_query(
             cycle_query,
             {"req_id": requirement_id},
         )
@@ -202,7 +202,7 @@ class PathFinder:
         ORDER BY depth
         """
 
-        results = await Neo4jClient.run_query(
+        results = await Neo4jClient.run_read_query(
             query,
             {"req_id": requirement_id, "max_depth": max_depth},
         )
@@ -267,7 +267,7 @@ class PathFinder:
                r.resolution as resolution
         """
 
-        results = await Neo4jClient.run_query(query, params)
+        results = await Neo4jClient.run_read_query(query, params)
 
         conflicts = []
         seen = set()
@@ -323,7 +323,7 @@ class PathFinder:
                [s IN r.sectors WHERE s IN e.sectors] as matching_sectors
         """
 
-        results = await Neo4jClient.run_query(
+        results = await Neo4jClient.run_read_query(
             query,
             {"entity_id": entity_id, "req_id": requirement_id},
         )
@@ -420,7 +420,7 @@ class PathFinder:
         LIMIT 1
         """
 
-        results = await Neo4jClient.run_query(
+        results = await Neo4jClient.run_read_query(
             query,
             {"from_id": from_id, "to_id": to_id},
         )
@@ -463,7 +463,7 @@ class PathFinder:
         RETURN count(e) as entity_count
         """
 
-        entity_result = await Neo4jClient.run_query(
+        entity_result = await Neo4jClient.run_read_query(
             entity_query,
             {"req_id": requirement_id},
         )
@@ -522,7 +522,7 @@ class PathFinder:
 
         params["total"] = len(requirement_ids)
 
-        results = await Neo4jClient.run_query(query, params)
+        results = await Neo4jClient.run_read_query(query, params)
 
         return [
             {
@@ -128,7 +128,7 @@ class RequirementQueryEngine:
         params.update(self._get_filter_params(filter))
 
         try:
-            results = await Neo4jClient.run_query(query, params)
+            results = await Neo4jClient.run_read_query(query, params)
             return [self._record_to_result(r, r.get("score")) for r in results]
         except Exception as e:
             logger.warning(
@@ -162,7 +162,7 @@ class RequirementQueryEngine:
         }
         params.update(self._get_filter_params(filter))
 
-        results = await Neo4jClient.run_query(query, params)
+        results = await Neo4jClient.run_read_query(query, params)
         return [self._record_to_result(r) for r in results]
 
     async def _filtered_search_with_contains(
@@ -197,7 +197,7 @@ class RequirementQueryEngine:
         }
         params.update(self._get_filter_params(filter))
 
-        results = await Neo4jClient.run_query(query, params)
+        results = await Neo4jClient.run_read_query(query, params)
         return [self._record_to_result(r) for r in results]
 
     def _build_where_clauses(self, filter: RequirementFilter) -> list[str]:
@@ -284,7 +284,7 @@ class RequirementQueryEngine:
         RETURN r
         """
 
-        results = await Neo4jClient.run_query(query, {"id": requirement_id})
+        results = await Neo4jClient.run_read_query(query, {"id": requirement_id})
 
         if not results:
             return None
@@ -306,7 +306,7 @@ class RequirementQueryEngine:
         LIMIT $limit
         """
 
-        results = await Neo4jClient.run_query(
+        results = await Neo4jClient.run_read_query(
             query,
             {"regulation_id": regulation_id, "skip": skip, "limit": limit},
         )
@@ -333,7 +333,7 @@ class RequirementQueryEngine:
         ORDER BY r.tier, r.regulation_id
         """
 
-        results = await Neo4jClient.run_query(query, {"entity_id": entity_id})
+        results = await Neo4jClient.run_read_query(query, {"entity_id": entity_id})
         return [self._record_to_result(r) for r in results]
 
     async def count_by_tier(
@@ -355,7 +355,7 @@ class RequirementQueryEngine:
         ORDER BY tier
         """
 
-        results = await Neo4jClient.run_query(query, params)
+        results = await Neo4jClient.run_read_query(query, params)
 
         return {r["tier"]: r["count"] for r in results}
 
@@ -368,5 +368,5 @@ class RequirementQueryEngine:
         ORDER BY count DESC
         """
 
-        results = await Neo4jClient.run_query(query)
+        results = await Neo4jClient.run_read_query(query)
         return {r["jurisdiction"]: r["count"] for r in results}
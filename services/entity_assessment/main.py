@@ -15,6 +15,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from services.entity_assessment.routes import assessments, entities, scores, tiers
 from shared.config import settings
+from shared.database.health import health_check_all, warm_up_all
 from shared.database.postgres import PostgresClient
 from shared.database.redis import RedisClient
 from shared.logging import get_logger, setup_logging
@@ -50,6 +51,9 @@ async def lifespan(app: FastAPI) -> Any:
         RedisClient.get_client()
         logger.info("redis_connected")
 
+        # Open pool connections before serving traffic
+        await warm_up_all({"postgres": PostgresClient.warm_up, "redis": RedisClient.warm_up})
+
     except Exception as e:
         logger.error("startup_failed", error=str(e))
         raise
@@ -94,15 +98,13 @@ async def health_check() -> HealthResponse:
 
     Returns health status of the service and its dependencies.
     """
-    components: dict[str, dict[str, Any]] = {}
-
-    # Check PostgreSQL
-    postgres_health = await PostgresClient.health_check()
-    components["postgres"] = postgres_health
-
-    # Check Redis
-    redis_health = await RedisClient.health_check()
-    components["redis"] = redis_health
+    # Check dependencies concurrently
+    components = await health_check_all(
+        {
+            "postgres": PostgresClient.health_check,
+            "redis": RedisClient.health_check,
+        }
+    )
 
     # Determine overall status
     all_healthy = all(c.get("status") == "healthy" for c in components.values())
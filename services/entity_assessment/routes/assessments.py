@@ -16,7 +16,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.auth import User, get_current_user
-from shared.database.postgres import get_postgres_session
+from shared.database.postgres import get_postgres_ro_session, get_postgres_session
 from shared.logging import get_logger
 from shared.models.assessment import (
     Assessment,
@@ -33,13 +33,17 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
-@router.get("", response_model=PaginatedResponse[AssessmentSummary])
+@router.get(
+    "",
+    response_model=PaginatedResponse[AssessmentSummary],
+    response_model_exclude_none=True,
+)
 async def list_assessments(
     entity_id: str | None = Query(default=None, description="Filter by entity"),
     status: AssessmentStatus | None = Query(default=None, description="Filter by status"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_postgres_session),
+    db: AsyncSession = Depends(get_postgres_ro_session),
 ) -> PaginatedResponse[AssessmentSummary]:
     """
     List assessments with optional filtering.
@@ -103,7 +107,7 @@ async def list_assessments(
 @router.get("/{assessment_id}", response_model=Assessment)
 async def get_assessment(
     assessment_id: str,
-    db: AsyncSession = Depends(get_postgres_session),
+    db: AsyncSession = Depends(get_postgres_ro_session),
 ) -> Assessment:
     """
     Get an assessment by ID.
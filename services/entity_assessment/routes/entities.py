@@ -17,7 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.entity_assessment.services.tier import TierService
 from shared.auth import User, get_current_user
-from shared.database.postgres import get_postgres_session
+from shared.database.postgres import get_postgres_ro_session, get_postgres_session
 from shared.logging import get_logger
 from shared.models.common import PaginatedResponse
 from shared.models.entity import (
@@ -37,14 +37,18 @@ router = APIRouter()
 tier_service = TierService()
 
 
-@router.get("", response_model=PaginatedResponse[EntitySummary])
+@router.get(
+    "",
+    response_model=PaginatedResponse[EntitySummary],
+    response_model_exclude_none=True,
+)
 async def list_entities(
     jurisdiction: str | None = Query(default=None, description="Filter by jurisdiction"),
     tier: ComplianceTier | None = Query(default=None, description="Filter by compliance tier"),
     search: str | None = Query(default=None, description="Search by name"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_postgres_session),
+    db: AsyncSession = Depends(get_postgres_ro_session),
 ) -> PaginatedResponse[EntitySummary]:
     """
     List entities with optional filtering.
@@ -136,7 +140,7 @@ async def list_entities(
 @router.get("/{entity_id}", response_model=Entity)
 async def get_entity(
     entity_id: str,
-    db: AsyncSession = Depends(get_postgres_session),
+    db: AsyncSession = Depends(get_postgres_ro_session),
 ) -> Entity:
     """
     Get an entity by ID.
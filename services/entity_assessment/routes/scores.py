@@ -15,7 +15,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.auth import User, get_current_user
-from shared.database.postgres import get_postgres_session
+from shared.database.postgres import get_postgres_ro_session, get_postgres_session
 from shared.database.redis import RedisClient
 from shared.logging import get_logger
 from shared.models.compliance import ComplianceScore, ComplianceSummary
@@ -29,7 +29,7 @@ router = APIRouter()
 @router.get("/{entity_id}", response_model=ComplianceScore)
 async def get_entity_score(
     entity_id: str,
-    db: AsyncSession = Depends(get_postgres_session),
+    db: AsyncSession = Depends(get_postgres_ro_session),
 ) -> ComplianceScore:
     """
     Get compliance score for an entity.
@@ -191,7 +191,7 @@ async def calculate_entity_score(
 @router.get("/{entity_id}/summary", response_model=ComplianceSummary)
 async def get_entity_compliance_summary(
     entity_id: str,
-    db: AsyncSession = Depends(get_postgres_session),
+    db: AsyncSession = Depends(get_postgres_ro_session),
 ) -> ComplianceSummary:
     """
     Get comprehensive compliance summary for an entity.
@@ -251,7 +251,7 @@ async def get_entity_compliance_summary(
 async def get_score_history(
     entity_id: str,
     limit: int = 20,
-    db: AsyncSession = Depends(get_postgres_session),
+    db: AsyncSession = Depends(get_postgres_ro_session),
 ) -> list[dict[str, Any]]:
     """
     Get compliance score history for an entity.
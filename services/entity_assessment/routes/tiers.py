@@ -19,7 +19,7 @@ from services.entity_assessment.services.tier import (
     TierService,
 )
 from shared.auth import User, get_current_user
-from shared.database.postgres import get_postgres_session
+from shared.database.postgres import get_postgres_ro_session, get_postgres_session
 from shared.logging import get_logger
 
 
@@ -149,7 +149,7 @@ async def calculate_tier(
 @router.get("/entity/{entity_id}", response_model=TierRecommendationResponse)
 async def get_entity_tier_recommendation(
     entity_id: str,
-    db: AsyncSession = Depends(get_postgres_session),
+    db: AsyncSession = Depends(get_postgres_ro_session),
 ) -> TierRecommendationResponse:
     """
     Get tier recommendation for an existing entity.
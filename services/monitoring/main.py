@@ -15,6 +15,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from services.monitoring.routes import alerts, events, metrics, streams
 from shared.config import settings
+from shared.database.health import health_check_all
 from shared.database.kafka import KafkaClient
 from shared.database.redis import RedisClient
 from shared.logging import get_logger, setup_logging
@@ -94,15 +95,13 @@ async def health_check() -> HealthResponse:
 
     Returns health status of the service and its dependencies.
     """
-    components: dict[str, dict[str, Any]] = {}
-
-    # Check Redis
-    redis_health = await RedisClient.health_check()
-    components["redis"] = redis_health
-
-    # Check Kafka
-    kafka_health = await KafkaClient.health_check()
-    components["kafka"] = kafka_health
+    # Check dependencies concurrently
+    components = await health_check_all(
+        {
+            "redis": RedisClient.health_check,
+            "kafka": KafkaClient.health_check,
+        }
+    )
 
     # Determine overall status
     all_healthy = all(c.get("status") == "healthy" for c in components.values())
@@ -416,6 +416,7 @@ class ChangeMonitor:
                     "detected_at": change.detected_at.isoformat(),
                 },
                 key=change.regulation_id,
+                wait=False,
             )
         except Exception as e:
             logger.error("kafka_publish_failed", error=str(e))
@@ -20,8 +20,11 @@ from services.regulatory_intelligence.routes import (
     requirements,
 )
 from shared.config import settings
+from shared.database.health import health_check_all, warm_up_all
 from shared.database.mongodb import MongoDBClient
 from shared.database.redis import RedisClient
+from shared.llm import close_llm_provider, warm_up_llm_provider
+from shared.llm.http import close_clients
 from shared.logging import get_logger, setup_logging
 from shared.models.common import HealthResponse
 
@@ -56,6 +59,9 @@ async def lifespan(app: FastAPI) -> Any:
         RedisClient.get_client()
         logger.info("redis_connected")
 
+        # Build the LLM provider and open its connection before serving traffic
+        await warm_up_all({"llm": warm_up_llm_provider})
+
     except Exception as e:
         logger.error("startup_failed", error=str(e))
         raise
@@ -66,6 +72,8 @@ async def lifespan(app: FastAPI) -> Any:
     logger.info("regulatory_intelligence_shutting_down")
     await MongoDBClient.close()
     await RedisClient.close()
+    await close_llm_provider()
+    await close_clients()
 
 
 # Create FastAPI application
@@ -100,15 +108,13 @@ async def health_check() -> HealthResponse:
 
     Returns health status of the service and its dependencies.
     """
-    components: dict[str, dict[str, Any]] = {}
-
-    # Check MongoDB
-    mongo_health = await MongoDBClient.health_check()
-    components["mongodb"] = mongo_health
-
-    # Check Redis
-    redis_health = await RedisClient.health_check()
-    components["redis"] = redis_health
+    # Check dependencies concurrently
+    components = await health_check_all(
+        {
+            "mongodb": MongoDBClient.health_check,
+            "redis": RedisClient.health_check,
+        }
+    )
 
     # Determine overall status
     all_healthy = all(c.get("status") == "healthy" for c in components.values())
@@ -552,6 +552,7 @@ async def execute_pipeline(
                     "processed_at": datetime.now(UTC).isoformat(),
                 },
                 key=regulation_id,
+                wait=False,
             )
         except Exception as e:
             logger.warning("kafka_publish_failed", error=str(e))
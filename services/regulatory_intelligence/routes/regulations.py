@@ -24,7 +24,11 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
-@router.get("", response_model=PaginatedResponse[RegulationSummary])
+@router.get(
+    "",
+    response_model=PaginatedResponse[RegulationSummary],
+    response_model_exclude_none=True,
+)
 async def list_regulations(
     jurisdiction: str | None = Query(default=None, description="Filter by jurisdiction"),
     sector: str | None = Query(default=None, description="Filter by sector"),
@@ -24,7 +24,11 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
-@router.get("", response_model=PaginatedResponse[Requirement])
+@router.get(
+    "",
+    response_model=PaginatedResponse[Requirement],
+    response_model_exclude_none=True,
+)
 async def list_requirements(
     regulation_id: str | None = Query(default=None, description="Filter by regulation"),
     tier: RequirementTier | None = Query(default=None, description="Filter by tier"),
@@ -14,12 +14,14 @@ from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 
 from services.verification.routes import audit, credentials, proofs, verification
-from shared.blockchain import BlockchainClient
+from shared.blockchain import BlockchainClient, get_blockchain_client
 from shared.config import settings
+from shared.database.health import health_check_all, warm_up_all
 from shared.database.postgres import PostgresClient
 from shared.database.redis import RedisClient
 from shared.logging import get_logger, setup_logging
 from shared.models.common import HealthResponse
+from shared.zk.worker import close_snarkjs_workers
 
 
 # Setup logging
@@ -51,6 +53,9 @@ async def lifespan(app: FastAPI) -> Any:
         RedisClient.get_client()
         logger.info("redis_connected")
 
+        # Open pool connections before serving traffic
+        await warm_up_all({"postgres": PostgresClient.warm_up, "redis": RedisClient.warm_up})
+
         # Initialize Blockchain client
         BlockchainClient.get_client()
         logger.info(
@@ -68,6 +73,7 @@ async def lifespan(app: FastAPI) -> Any:
     logger.info("verification_service_shutting_down")
     await PostgresClient.close()
     await RedisClient.close()
+    await close_snarkjs_workers()
 
 
 # Create FastAPI application
@@ -102,19 +108,14 @@ async def health_check() -> HealthResponse:
 
     Returns health status of the service and its dependencies.
     """
-    components: dict[str, dict[str, Any]] = {}
-
-    # Check PostgreSQL
-    postgres_health = await PostgresClient.health_check()
-    components["postgres"] = postgres_health
-
-    # Check Redis
-    redis_health = await RedisClient.health_check()
-    components["redis"] = redis_health
-
-    # Check Blockchain
-    blockchain_health = await BlockchainClient.health_check()
-    components["blockchain"] = blockchain_health
+    # Check dependencies concurrently
+    components = await health_check_all(
+        {
+            "postgres": PostgresClient.health_check,
+            "redis": RedisClient.health_check,
+            "blockchain": get_blockchain_client().health_check,
+        }
+    )
 
     # Determine overall status
     all_healthy = all(c.get("status") == "healthy" for c in components.values())
@@ -11,7 +11,7 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
 from shared.logging import get_logger
-from shared.zk.models import ProofType
+from shared.zk.models import ProofType, Score, Tier
 from shared.zk.prover import ComplianceProver
 
 
@@ -28,8 +28,8 @@ class ThresholdProofRequest(BaseModel):
     """Request to generate a threshold proof."""
 
     entity_id: str = Field(..., description="Entity identifier (e.g., LEI)")
-    score: int = Field(..., ge=0, le=10000, description="Actual compliance score")
-    threshold: int = Field(..., ge=0, le=10000, description="Minimum required score")
+    score: Score = Field(..., description="Actual compliance score")
+    threshold: Score = Field(..., description="Minimum required score")
 
     model_config = {
         "json_schema_extra": {
@@ -42,17 +42,17 @@ class RangeProofRequest(BaseModel):
     """Request to generate a range proof."""
 
     entity_id: str = Field(..., description="Entity identifier")
-    score: int = Field(..., ge=0, le=10000, description="Actual compliance score")
-    min_score: int = Field(..., ge=0, le=10000, description="Minimum of range")
-    max_score: int = Field(..., ge=0, le=10000, description="Maximum of range")
+    score: Score = Field(..., description="Actual compliance score")
+    min_score: Score = Field(..., description="Minimum of range")
+    max_score: Score = Field(..., description="Maximum of range")
 
 
 class TierProofRequest(BaseModel):
     """Request to generate a tier membership proof."""
 
     entity_id: str = Field(..., description="Entity identifier")
-    score: int = Field(..., ge=0, le=10000, description="Actual compliance score")
-    tier: int = Field(..., ge=1, le=5, description="Target compliance tier (1-5)")
+    score: Score = Field(..., description="Actual compliance score")
+    tier: Tier = Field(..., description="Target compliance tier (1-5)")
 
 
 class ProofResponse(BaseModel):
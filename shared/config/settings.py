@@ -8,11 +8,24 @@ Version: 0.1.0
 """
 
 from enum import Enum
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Annotated, Any, Literal
 
-from pydantic import Field, SecretStr, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import BeforeValidator, Field, SecretStr, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+
+def _split_csv(value: Any) -> Any:
+    """Split a comma-separated string into stripped, non-empty items."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return value
+
+
+# Comma-separated list parsed once at settings construction.
+# NoDecode keeps pydantic-settings from JSON-decoding the raw env value.
+CSVList = Annotated[list[str], NoDecode, BeforeValidator(_split_csv)]
 
 
 class Environment(str, Enum):
@@ -53,21 +66,30 @@ class BlockchainMode(str, Enum):
 class PostgresSettings(BaseSettings):
     """PostgreSQL database configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="POSTGRES_")
+    model_config = SettingsConfigDict(env_prefix="POSTGRES_", frozen=True)
 
     host: str = "localhost"
     port: int = 5432
     user: str = "civium"
     password: SecretStr = SecretStr("civium_dev_password")
     db: str = "civium"
-
-    @property
+    # Connection pool sizing, per engine in each worker process
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30.0
+    pool_recycle: int = 3600
+    # Connections opened at service startup, before any traffic
+    warm_up_connections: int = 2
+    # asyncpg prepared statement cache; set to 0 behind PgBouncer transaction pooling
+    statement_cache_size: int = 500
+
+    @cached_property
     def async_url(self) -> str:
         """Generate async SQLAlchemy connection URL."""
         pwd = self.password.get_secret_value()
         return f"postgresql+asyncpg://{self.user}:{pwd}@{self.host}:{self.port}/{self.db}"
 
-    @property
+    @cached_property
     def sync_url(self) -> str:
         """Generate sync SQLAlchemy connection URL."""
         pwd = self.password.get_secret_value()
@@ -77,8 +99,10 @@ class PostgresSettings(BaseSettings):
 class Neo4jSettings(BaseSettings):
     """Neo4j graph database configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="NEO4J_")
+    model_config = SettingsConfigDict(env_prefix="NEO4J_", frozen=True)
 
+    # "neo4j" routes reads/writes across a cluster; "bolt" connects directly
+    scheme: str = "neo4j"
     host: str = "localhost"
     bolt_port: int = Field(default=7687, alias="NEO4J_BOLT_PORT")
     http_port: int = Field(default=7474, alias="NEO4J_HTTP_PORT")
@@ -87,14 +111,14 @@ class Neo4jSettings(BaseSettings):
 
     @property
     def uri(self) -> str:
-        """Generate Neo4j Bolt URI."""
-        return f"bolt://{self.host}:{self.bolt_port}"
+        """Generate Neo4j connection URI."""
+        return f"{self.scheme}://{self.host}:{self.bolt_port}"
 
 
 class MongoSettings(BaseSettings):
     """MongoDB configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="MONGODB_")
+    model_config = SettingsConfigDict(env_prefix="MONGODB_", frozen=True)
 
     host: str = "localhost"
     port: int = 27017
@@ -102,7 +126,7 @@ class MongoSettings(BaseSettings):
     password: SecretStr = SecretStr("civium_mongo_password")
     db: str = Field(default="civium_regulations", alias="MONGODB_DB")
 
-    @property
+    @cached_property
     def uri(self) -> str:
         """Generate MongoDB connection URI."""
         pwd = self.password.get_secret_value()
@@ -112,14 +136,16 @@ class MongoSettings(BaseSettings):
 class RedisSettings(BaseSettings):
     """Redis cache configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="REDIS_")
+    model_config = SettingsConfigDict(env_prefix="REDIS_", frozen=True)
 
     host: str = "localhost"
     port: int = 6379
     password: SecretStr = SecretStr("civium_redis_password")
     db: int = 0
+    # RESP3 needs Redis >= 6.0; set to 2 for older servers
+    protocol: int = 3
 
-    @property
+    @cached_property
     def url(self) -> str:
         """Generate Redis connection URL."""
         pwd = self.password.get_secret_value()
@@ -129,7 +155,7 @@ class RedisSettings(BaseSettings):
 class InfluxSettings(BaseSettings):
     """InfluxDB time-series configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="INFLUXDB_")
+    model_config = SettingsConfigDict(env_prefix="INFLUXDB_", frozen=True)
 
     host: str = "localhost"
     port: int = 8086
@@ -146,16 +172,18 @@ class InfluxSettings(BaseSettings):
 class KafkaSettings(BaseSettings):
     """Kafka event streaming configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="KAFKA_")
+    model_config = SettingsConfigDict(env_prefix="KAFKA_", frozen=True)
 
-    bootstrap_servers: str = "localhost:9092"
+    bootstrap_servers: CSVList = ["localhost:9092"]
     security_protocol: str = "PLAINTEXT"
+    # lz4/zstd/snappy need the matching aiokafka extra installed
+    compression: Literal["gzip", "lz4", "zstd", "snappy", "none"] = "lz4"
 
 
 class ClaudeSettings(BaseSettings):
     """Anthropic Claude API configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="CLAUDE_")
+    model_config = SettingsConfigDict(env_prefix="CLAUDE_", frozen=True)
 
     api_key: SecretStr = Field(
         default=SecretStr(""),
@@ -168,7 +196,7 @@ class ClaudeSettings(BaseSettings):
 class OpenAISettings(BaseSettings):
     """OpenAI API configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="OPENAI_")
+    model_config = SettingsConfigDict(env_prefix="OPENAI_", frozen=True)
 
     api_key: SecretStr = SecretStr("")
     model: str = "gpt-4-turbo-preview"
@@ -177,21 +205,31 @@ class OpenAISettings(BaseSettings):
 class OllamaSettings(BaseSettings):
     """Ollama local LLM configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="OLLAMA_")
+    model_config = SettingsConfigDict(env_prefix="OLLAMA_", frozen=True)
 
     host: str = "http://localhost:11434"
     model: str = "llama3.3:70b"
+    # Keep at or below the server's OLLAMA_NUM_PARALLEL
+    num_parallel: int = 4
+
+    # HTTP connection pool
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_connect_timeout: float = 5.0
 
 
 class LLMSettings(BaseSettings):
     """LLM provider configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="LLM_")
+    model_config = SettingsConfigDict(env_prefix="LLM_", frozen=True)
 
     provider: LLMProvider = LLMProvider.CLAUDE
     temperature: float = 0.1
     max_retries: int = 3
     timeout_seconds: int = 120
+    # In-flight requests per batch_complete() call
+    max_concurrency: int = 8
 
     # Provider-specific settings
     claude: ClaudeSettings = Field(default_factory=ClaudeSettings)
@@ -199,10 +237,17 @@ class LLMSettings(BaseSettings):
     ollama: OllamaSettings = Field(default_factory=OllamaSettings)
 
 
+_RPC_URL_TEMPLATES: dict[BlockchainMode, str] = {
+    BlockchainMode.MOCK: "",
+    BlockchainMode.TESTNET: "https://polygon-mumbai.g.alchemy.com/v2/{key}",
+    BlockchainMode.MAINNET: "https://polygon-mainnet.g.alchemy.com/v2/{key}",
+}
+
+
 class BlockchainSettings(BaseSettings):
     """Blockchain integration configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="BLOCKCHAIN_")
+    model_config = SettingsConfigDict(env_prefix="BLOCKCHAIN_", frozen=True)
 
     mode: BlockchainMode = BlockchainMode.MOCK
 
@@ -212,21 +257,28 @@ class BlockchainSettings(BaseSettings):
     audit_contract_address: str = ""
     did_registry_address: str = ""
 
-    @property
+    @cached_property
     def rpc_url(self) -> str:
-        """Generate RPC URL based on mode."""
-        if self.mode == BlockchainMode.MOCK:
+        """Generate RPC URL based on mode, resolving the key on first access."""
+        template = _RPC_URL_TEMPLATES[self.mode]
+        if not template:
             return ""
-        key = self.alchemy_api_key.get_secret_value()
-        if self.mode == BlockchainMode.TESTNET:
-            return f"https://polygon-mumbai.g.alchemy.com/v2/{key}"
-        return f"https://polygon-mainnet.g.alchemy.com/v2/{key}"
+        return template.format(key=self.alchemy_api_key.get_secret_value())
+
+
+class ZKSettings(BaseSettings):
+    """ZK-SNARK proving configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="ZK_", frozen=True)
+
+    # Native Groth16 prover binary (iden3 rapidsnark); unset proves with snarkjs
+    rapidsnark_path: str | None = None
 
 
 class JWTSettings(BaseSettings):
     """JWT authentication configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="JWT_")
+    model_config = SettingsConfigDict(env_prefix="JWT_", frozen=True)
 
     secret_key: SecretStr = SecretStr("your-jwt-secret-key-min-32-chars-long")
     algorithm: str = "HS256"
@@ -237,7 +289,7 @@ class JWTSettings(BaseSettings):
 class RateLimitSettings(BaseSettings):
     """Rate limiting configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="RATE_LIMIT_")
+    model_config = SettingsConfigDict(env_prefix="RATE_LIMIT_", frozen=True)
 
     enabled: bool = True
     requests_per_minute: int = 100
@@ -247,20 +299,22 @@ class RateLimitSettings(BaseSettings):
 class CORSSettings(BaseSettings):
     """CORS configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="CORS_")
+    model_config = SettingsConfigDict(env_prefix="CORS_", frozen=True)
 
-    origins: str = "http://localhost:3000,http://localhost:5173"
+    origins: CSVList = ["http://localhost:3000", "http://localhost:5173"]
     allow_credentials: bool = True
 
     @property
     def origins_list(self) -> list[str]:
-        """Parse origins string into list."""
-        return [o.strip() for o in self.origins.split(",") if o.strip()]
+        """Get parsed origins list."""
+        return self.origins
 
 
 class ServicePorts(BaseSettings):
     """Service port configuration."""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     regulatory_intelligence: int = Field(default=8001, alias="REGULATORY_INTELLIGENCE_PORT")
     compliance_graph: int = Field(default=8002, alias="COMPLIANCE_GRAPH_PORT")
     entity_assessment: int = Field(default=8003, alias="ENTITY_ASSESSMENT_PORT")
@@ -275,6 +329,8 @@ class Settings(BaseSettings):
 
     Loads configuration from environment variables with sensible defaults.
     Use the global `settings` singleton or call `get_settings()`.
+
+    All settings models are frozen: configuration is read-only once loaded.
     """
 
     model_config = SettingsConfigDict(
@@ -282,6 +338,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # General
@@ -310,6 +367,9 @@ class Settings(BaseSettings):
     # Blockchain configuration
     blockchain: BlockchainSettings = Field(default_factory=BlockchainSettings)
 
+    # ZK proofs
+    zk: ZKSettings = Field(default_factory=ZKSettings)
+
     # Authentication
     jwt: JWTSettings = Field(default_factory=JWTSettings)
 
@@ -348,7 +408,7 @@ class Settings(BaseSettings):
     @property
     def cors_origins(self) -> str:
         """Get CORS origins string."""
-        return self.cors.origins
+        return ",".join(self.cors.origins)
 
 
 @lru_cache
@@ -29,6 +29,7 @@ Usage:
         ...
 """
 
+from shared.database.health import health_check_all, warm_up_all
 from shared.database.kafka import (
     KafkaClient,
     get_kafka_consumer,
@@ -45,6 +46,7 @@ from shared.database.neo4j import (
 from shared.database.postgres import (
     Base,
     PostgresClient,
+    get_postgres_ro_session,
     get_postgres_session,
 )
 from shared.database.redis import (
@@ -56,6 +58,7 @@ from shared.database.redis import (
 __all__ = [
     # PostgreSQL
     "get_postgres_session",
+    "get_postgres_ro_session",
     "PostgresClient",
     "Base",
     # Neo4j
@@ -71,4 +74,7 @@ __all__ = [
     "get_kafka_producer",
     "get_kafka_consumer",
     "KafkaClient",
+    # Health
+    "health_check_all",
+    "warm_up_all",
 ]
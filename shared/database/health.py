@@ -0,0 +1,95 @@
+"""
+Health Checks
+=============
+
+Concurrent health checks and connection warm-up across Civium data stores.
+
+Version: 0.1.0
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from shared.database.neo4j import Neo4jClient
+from shared.database.postgres import PostgresClient
+from shared.database.redis import RedisClient
+from shared.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+HealthCheck = Callable[[], Awaitable[dict[str, Any]]]
+WarmUp = Callable[[], Awaitable[None]]
+
+
+async def health_check_all(
+    checks: Mapping[str, HealthCheck] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Run health checks concurrently.
+
+    Total latency is the slowest check rather than the sum of all of them.
+
+    Args:
+        checks: Component name to health check coroutine function
+            (default: PostgreSQL, Redis and Neo4j)
+
+    Returns:
+        Health result per component; a check that raises is reported as unhealthy
+
+    Usage:
+        components = await health_check_all(
+            {"postgres": PostgresClient.health_check, "redis": RedisClient.health_check}
+        )
+    """
+    if checks is None:
+        checks = {
+            "postgres": PostgresClient.health_check,
+            "redis": RedisClient.health_check,
+            "neo4j": Neo4jClient.health_check,
+        }
+
+    results = await asyncio.gather(
+        *(check() for check in checks.values()),
+        return_exceptions=True,
+    )
+
+    return {
+        name: (
+            {"status": "unhealthy", "error": repr(result)}
+            if isinstance(result, BaseException)
+            else result
+        )
+        for name, result in zip(checks, results)
+    }
+
+
+async def warm_up_all(
+    warmers: Mapping[str, WarmUp] | None = None,
+) -> None:
+    """
+    Pre-populate connection pools concurrently at startup.
+
+    Moves TCP/TLS/auth handshakes off the request path. Warm-up is best
+    effort: a failing store is logged and left to connect lazily.
+
+    Args:
+        warmers: Component name to warm-up coroutine function
+            (default: PostgreSQL, Redis and Neo4j)
+    """
+    if warmers is None:
+        warmers = {
+            "postgres": PostgresClient.warm_up,
+            "redis": RedisClient.warm_up,
+            "neo4j": Neo4jClient.warm_up,
+        }
+
+    results = await asyncio.gather(
+        *(warm() for warm in warmers.values()),
+        return_exceptions=True,
+    )
+
+    for name, result in zip(warmers, results):
+        if isinstance(result, BaseException):
+            logger.warning("connection_warm_up_failed", component=name, error=str(result))
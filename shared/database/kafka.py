@@ -7,10 +7,14 @@ Async Kafka producer and consumer for event streaming.
 Version: 0.1.0
 """
 
+import asyncio
+import time
 from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import Any
 
+import orjson
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
 
 from shared.config import settings
@@ -46,7 +50,9 @@ class KafkaClient:
                 security_protocol=settings.kafka.security_protocol,
                 value_serializer=lambda v: v.encode("utf-8") if isinstance(v, str) else v,
                 key_serializer=lambda k: k.encode("utf-8") if k and isinstance(k, str) else k,
-                compression_type="gzip",
+                compression_type=(
+                    None if settings.kafka.compression == "none" else settings.kafka.compression
+                ),
                 acks="all",
                 retries=3,
             )
@@ -103,8 +109,6 @@ class KafkaClient:
         Returns:
             dict with status and cluster info
         """
-        import time
-
         try:
             start = time.perf_counter()
             producer = await cls.get_producer()
@@ -137,6 +141,7 @@ class KafkaClient:
         value: str | bytes | dict[str, Any],
         key: str | None = None,
         headers: dict[str, str] | None = None,
+        wait: bool = True,
     ) -> dict[str, Any]:
         """
         Publish a message to a topic.
@@ -146,26 +151,43 @@ class KafkaClient:
             value: Message value (str, bytes, or dict)
             key: Optional message key for partitioning
             headers: Optional message headers
+            wait: Await broker acknowledgement. When False the record is
+                queued in the producer's batch accumulator and delivery
+                errors are logged asynchronously.
 
         Returns:
-            Dict with partition and offset information
+            Dict with partition and offset information (None when not waiting)
         """
-        import json
-
         producer = await cls.get_producer()
 
         # Serialize dict to JSON
         if isinstance(value, dict):
-            value = json.dumps(value)
+            value = orjson.dumps(value)
 
         # Convert headers to tuple format
         kafka_headers = None
         if headers:
             kafka_headers = [(k, v.encode("utf-8")) for k, v in headers.items()]
 
+        payload = value.encode("utf-8") if isinstance(value, str) else value
+
+        if not wait:
+            future = await producer.send(
+                topic,
+                value=payload,
+                key=key,
+                headers=kafka_headers,
+            )
+            future.add_done_callback(partial(_log_delivery_error, topic, key))
+            return {
+                "partition": None,
+                "offset": None,
+                "topic": topic,
+            }
+
         result = await producer.send_and_wait(
             topic,
-            value=value.encode("utf-8") if isinstance(value, str) else value,
+            value=payload,
             key=key,
             headers=kafka_headers,
         )
@@ -184,6 +206,12 @@ class KafkaClient:
             "topic": result.topic,
         }
 
+    @classmethod
+    async def flush(cls) -> None:
+        """Wait until all queued fire-and-forget messages are delivered."""
+        if cls._producer is not None:
+            await cls._producer.flush()
+
     @classmethod
     async def publish_batch(
         cls,
@@ -200,8 +228,6 @@ class KafkaClient:
         Returns:
             Number of messages published
         """
-        import json
-
         producer = await cls.get_producer()
         count = 0
 
@@ -209,7 +235,7 @@ class KafkaClient:
         for msg in messages:
             value = msg["value"]
             if isinstance(value, dict):
-                value = json.dumps(value)
+                value = orjson.dumps(value)
             if isinstance(value, str):
                 value = value.encode("utf-8")
 
@@ -239,6 +265,20 @@ class KafkaClient:
         return count
 
 
+def _log_delivery_error(topic: str, key: str | None, future: asyncio.Future[Any]) -> None:
+    """Log delivery failures for messages published without waiting."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.error(
+            "kafka_message_delivery_failed",
+            topic=topic,
+            key=key,
+            error=str(error),
+        )
+
+
 # Predefined topics
 class Topics:
     """Kafka topic names."""
@@ -7,6 +7,7 @@ Async MongoDB client using Motor for regulatory documents.
 Version: 0.1.0
 """
 
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -28,6 +29,7 @@ class MongoDBClient:
     """
 
     _client: AsyncIOMotorClient | None = None  # type: ignore[type-arg]
+    _version: str | None = None
 
     @classmethod
     def get_client(cls) -> AsyncIOMotorClient:  # type: ignore[type-arg]
@@ -68,6 +70,7 @@ class MongoDBClient:
         if cls._client is not None:
             cls._client.close()
             cls._client = None
+            cls._version = None
             logger.info("mongodb_client_closed")
 
     @classmethod
@@ -78,8 +81,6 @@ class MongoDBClient:
         Returns:
             dict with status and server info
         """
-        import time
-
         try:
             start = time.perf_counter()
             client = cls.get_client()
@@ -87,14 +88,19 @@ class MongoDBClient:
             result = await client.admin.command("ping")
             latency_ms = (time.perf_counter() - start) * 1000
 
-            # Get server info
-            server_info = await client.admin.command("serverStatus")
+            # hello is a few hundred bytes, unlike the full serverStatus document
+            hello = await client.admin.command("hello")
+
+            # Server version does not change while connected; fetch it once
+            if cls._version is None:
+                build_info = await client.admin.command("buildInfo")
+                cls._version = build_info.get("version", "unknown")
 
             return {
                 "status": "healthy" if result.get("ok") == 1 else "unhealthy",
                 "latency_ms": round(latency_ms, 2),
-                "version": server_info.get("version", "unknown"),
-                "uptime_seconds": server_info.get("uptime", 0),
+                "version": cls._version,
+                "primary": hello.get("isWritablePrimary", False),
             }
         except Exception as e:
             logger.error("mongodb_health_check_failed", error=str(e))
@@ -7,11 +7,13 @@ Async Neo4j driver for the Compliance Graph Engine.
 Version: 0.1.0
 """
 
-from collections.abc import AsyncGenerator
+import asyncio
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 
-from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
+from neo4j import READ_ACCESS, AsyncDriver, AsyncGraphDatabase, AsyncSession
 
 from shared.config import settings
 from shared.logging import get_logger
@@ -19,6 +21,17 @@ from shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Summary counters reported by write queries
+_WRITE_COUNTERS = (
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+    "labels_added",
+    "labels_removed",
+)
+
 
 class Neo4jClient:
     """
@@ -41,6 +54,8 @@ class Neo4jClient:
                 ),
                 max_connection_pool_size=50,
                 connection_acquisition_timeout=30.0,
+                # Only ping connections idle longer than this on acquire
+                liveness_check_timeout=60.0,
             )
             logger.info(
                 "neo4j_driver_created",
@@ -56,6 +71,25 @@ class Neo4jClient:
             cls._driver = None
             logger.info("neo4j_driver_closed")
 
+    @classmethod
+    async def warm_up(cls, connections: int = 10) -> None:
+        """
+        Open pool connections ahead of the first request.
+
+        Args:
+            connections: Concurrent sessions to open
+        """
+        driver = cls.get_driver()
+        await driver.verify_connectivity()
+
+        async def _touch() -> None:
+            async with driver.session() as session:
+                result = await session.run("RETURN 1 AS n")
+                await result.consume()
+
+        await asyncio.gather(*(_touch() for _ in range(connections)))
+        logger.info("neo4j_pool_warmed", connections=connections)
+
     @classmethod
     async def health_check(cls) -> dict[str, Any]:
         """
@@ -64,8 +98,6 @@ class Neo4jClient:
         Returns:
             dict with status and server info
         """
-        import time
-
         try:
             start = time.perf_counter()
             driver = cls.get_driver()
@@ -114,6 +146,94 @@ class Neo4jClient:
             records = await result.data()
             return records
 
+    @classmethod
+    async def stream_query(
+        cls,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str = "neo4j",
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Execute a Cypher query and yield records as they arrive.
+
+        Unlike run_query, the full result set is never held in memory.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Database name
+
+        Yields:
+            Result records as dictionaries
+        """
+        driver = cls.get_driver()
+        async with driver.session(database=database) as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                yield record.data()
+
+    @classmethod
+    async def run_query_columns(
+        cls,
+        query: str,
+        keys: list[str],
+        parameters: dict[str, Any] | None = None,
+        database: str = "neo4j",
+    ) -> tuple[list[Any], ...]:
+        """
+        Execute a Cypher query and return results column by column.
+
+        Skips building a dict per row; suited to callers that know the
+        result schema or feed columnar consumers (NumPy, pandas).
+
+        Args:
+            query: Cypher query string
+            keys: Result keys to extract, in order
+            parameters: Query parameters
+            database: Database name
+
+        Returns:
+            One list of values per key
+        """
+        driver = cls.get_driver()
+        async with driver.session(database=database) as session:
+            result = await session.run(query, parameters or {})
+            rows = await result.values(*keys)
+
+        if not rows:
+            return tuple([] for _ in keys)
+        return tuple(list(column) for column in zip(*rows))
+
+    @classmethod
+    async def run_read_query(
+        cls,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str = "neo4j",
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a read-only Cypher query in a read transaction.
+
+        With a routing (neo4j://) URI the driver sends read transactions to
+        cluster followers/read replicas instead of the leader.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            database: Database name
+
+        Returns:
+            List of result records as dictionaries
+        """
+        driver = cls.get_driver()
+
+        async def _read_tx(tx: Any) -> list[dict[str, Any]]:
+            result = await tx.run(query, parameters or {})
+            return await result.data()
+
+        async with driver.session(database=database, default_access_mode=READ_ACCESS) as session:
+            return await session.execute_read(_read_tx)
+
     @classmethod
     async def run_write_query(
         cls,
@@ -138,19 +258,59 @@ class Neo4jClient:
             result = await tx.run(query, parameters or {})
             summary = await result.consume()
             counters = summary.counters
-            return {
-                "nodes_created": counters.nodes_created,
-                "nodes_deleted": counters.nodes_deleted,
-                "relationships_created": counters.relationships_created,
-                "relationships_deleted": counters.relationships_deleted,
-                "properties_set": counters.properties_set,
-                "labels_added": counters.labels_added,
-                "labels_removed": counters.labels_removed,
-            }
+            return {field: getattr(counters, field) for field in _WRITE_COUNTERS}
 
         async with driver.session(database=database) as session:
             return await session.execute_write(_write_tx)
 
+    @classmethod
+    async def run_write_batch(
+        cls,
+        query: str,
+        rows: list[dict[str, Any]],
+        batch_size: int = 10_000,
+        database: str = "neo4j",
+    ) -> dict[str, Any]:
+        """
+        Execute an UNWIND write query over many rows.
+
+        Each chunk of rows is sent as one `$rows` parameter and committed in
+        a single transaction, replacing N single-row round-trips with one per
+        chunk. Chunking keeps Bolt messages and transaction state bounded.
+
+        Rewrite per-row callers from:
+            for row in rows:
+                await Neo4jClient.run_write_query("MERGE (n:Node {id: $id})", row)
+        to:
+            await Neo4jClient.run_write_batch(
+                "UNWIND $rows AS row MERGE (n:Node {id: row.id})", rows
+            )
+
+        Args:
+            query: Cypher query consuming `UNWIND $rows AS row`
+            rows: Parameter dicts, one per row
+            batch_size: Rows per transaction
+            database: Database name
+
+        Returns:
+            Query counters summed across all batches
+        """
+        driver = cls.get_driver()
+        totals = dict.fromkeys(_WRITE_COUNTERS, 0)
+
+        async def _write_tx(tx: Any, batch: list[dict[str, Any]]) -> Any:
+            result = await tx.run(query, rows=batch)
+            summary = await result.consume()
+            return summary.counters
+
+        async with driver.session(database=database) as session:
+            for start in range(0, len(rows), batch_size):
+                counters = await session.execute_write(_write_tx, rows[start : start + batch_size])
+                for field in _WRITE_COUNTERS:
+                    totals[field] += getattr(counters, field)
+
+        return totals
+
 
 async def get_neo4j_driver() -> AsyncDriver:
     """
@@ -7,6 +7,9 @@ Async PostgreSQL client using SQLAlchemy 2.0 with asyncpg.
 Version: 0.1.0
 """
 
+import asyncio
+import time
+import uuid
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -27,6 +30,26 @@ from shared.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _connect_args() -> dict[str, Any]:
+    """
+    Build asyncpg connection arguments.
+
+    Sizes both the SQLAlchemy and asyncpg prepared statement caches and
+    disables JIT, which only adds planning latency for short OLTP queries.
+    A cache size of 0 is the escape hatch for PgBouncer transaction pooling;
+    statements then get unique names so they never collide across backends.
+    """
+    cache_size = settings.postgres.statement_cache_size
+    connect_args: dict[str, Any] = {
+        "prepared_statement_cache_size": cache_size,
+        "statement_cache_size": cache_size,
+        "server_settings": {"jit": "off"},
+    }
+    if cache_size == 0:
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4().hex}__"
+    return connect_args
+
+
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base for ORM models."""
 
@@ -50,10 +73,13 @@ class PostgresClient:
             cls._engine = create_async_engine(
                 settings.postgres.async_url,
                 echo=settings.debug,
-                pool_size=10,
-                max_overflow=20,
+                pool_size=settings.postgres.pool_size,
+                max_overflow=settings.postgres.max_overflow,
+                pool_timeout=settings.postgres.pool_timeout,
+                pool_recycle=settings.postgres.pool_recycle,
                 pool_pre_ping=True,
-                pool_recycle=3600,
+                pool_use_lifo=True,
+                connect_args=_connect_args(),
             )
             logger.info(
                 "postgres_engine_created",
@@ -84,6 +110,28 @@ class PostgresClient:
             cls._session_factory = None
             logger.info("postgres_engine_closed")
 
+    @classmethod
+    async def warm_up(cls, connections: int | None = None) -> None:
+        """
+        Open pool connections ahead of the first request.
+
+        Args:
+            connections: Connections to open (default: settings
+                warm_up_connections), capped at the pool size
+        """
+        engine = cls.get_engine()
+
+        async def _touch() -> None:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        count = min(
+            connections or settings.postgres.warm_up_connections,
+            settings.postgres.pool_size,
+        )
+        await asyncio.gather(*(_touch() for _ in range(count)))
+        logger.info("postgres_pool_warmed", connections=count)
+
     @classmethod
     async def health_check(cls) -> dict[str, Any]:
         """
@@ -92,8 +140,6 @@ class PostgresClient:
         Returns:
             dict with status and latency
         """
-        import time
-
         try:
             start = time.perf_counter()
             async with cls.get_session_factory()() as session:
@@ -129,12 +175,30 @@ async def get_postgres_session() -> AsyncGenerator[AsyncSession, None]:
     async with session_factory() as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
 
 
+async def get_postgres_ro_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that yields a read-only PostgreSQL session.
+
+    The session runs on an autocommit connection, so reads issue no
+    BEGIN/COMMIT round-trips. Use it for endpoints that only SELECT.
+
+    Usage:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_postgres_ro_session)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
+    """
+    async with postgres_ro_session() as session:
+        yield session
+
+
 @asynccontextmanager
 async def postgres_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -148,7 +212,23 @@ async def postgres_session() -> AsyncGenerator[AsyncSession, None]:
     async with session_factory() as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
+
+
+@asynccontextmanager
+async def postgres_ro_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Context manager for read-only PostgreSQL sessions.
+
+    Usage:
+        async with postgres_ro_session() as session:
+            result = await session.execute(select(Item))
+    """
+    async with PostgresClient.get_engine().connect() as connection:
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        async with AsyncSession(bind=connection, autoflush=False) as session:
+            yield session
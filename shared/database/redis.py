@@ -7,12 +7,17 @@ Async Redis client for caching and session management.
 Version: 0.1.0
 """
 
+import asyncio
+import time
+import uuid
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
+import orjson
 import redis.asyncio as aioredis
 from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
 
 from shared.config import settings
 from shared.logging import get_logger
@@ -20,6 +25,65 @@ from shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+_DELETE_BATCH_SIZE = 500
+_LOCK_WAIT_SLICE_SECONDS = 1.0
+# Lock waiters parked in BLPOP at once. Each holds a pool connection for
+# the whole wait, and the pool raises rather than queues when exhausted,
+# so this must stay well under max_connections.
+_MAX_LOCK_WAITERS = 10
+
+# Increment a counter and start its window on the first hit.
+# register_script runs this via EVALSHA and reloads it on NOSCRIPT.
+_RATE_LIMIT_LUA = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return current
+"""
+
+# Delete the lock only if it still holds our token, then wake one waiter.
+_UNLOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    redis.call('RPUSH', KEYS[2], '1')
+    redis.call('EXPIRE', KEYS[2], 1)
+    return 1
+end
+return 0
+"""
+
+
+# Type tags written ahead of cached values so reads branch instead of
+# attempting a JSON parse. The leading NUL never starts legacy JSON or
+# text values, which still decode through the fallback path.
+_JSON_TAG = "\x00J"
+_RAW_TAG = "\x00R"
+_TAG_LENGTH = len(_JSON_TAG)
+
+
+def _encode_cached(value: Any) -> str | bytes:
+    """Tag strings and bytes as raw; JSON-encode everything else."""
+    if isinstance(value, str):
+        return _RAW_TAG + value
+    if isinstance(value, bytes):
+        return _RAW_TAG.encode() + value
+    return _JSON_TAG.encode() + orjson.dumps(value, option=orjson.OPT_SERIALIZE_DATACLASS)
+
+
+def _decode_cached(value: str) -> Any:
+    """Decode a tagged cache value."""
+    if value.startswith(_JSON_TAG):
+        return orjson.loads(value[_TAG_LENGTH:])
+    if value.startswith(_RAW_TAG):
+        return value[_TAG_LENGTH:]
+
+    # Legacy untagged value: JSON if it parses, raw string otherwise
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return value
+
 
 class RedisClient:
     """
@@ -29,6 +93,9 @@ class RedisClient:
     """
 
     _client: Redis | None = None  # type: ignore[type-arg]
+    _rate_limit_script: AsyncScript | None = None
+    _unlock_script: AsyncScript | None = None
+    _lock_wait_slots: asyncio.Semaphore | None = None
 
     @classmethod
     def get_client(cls) -> Redis:  # type: ignore[type-arg]
@@ -39,6 +106,7 @@ class RedisClient:
                 encoding="utf-8",
                 decode_responses=True,
                 max_connections=50,
+                protocol=settings.redis.protocol,
             )
             logger.info(
                 "redis_client_created",
@@ -52,8 +120,23 @@ class RedisClient:
         if cls._client is not None:
             await cls._client.close()
             cls._client = None
+            cls._rate_limit_script = None
+            cls._unlock_script = None
+            cls._lock_wait_slots = None
             logger.info("redis_client_closed")
 
+    @classmethod
+    async def warm_up(cls, connections: int = 10) -> None:
+        """
+        Open pool connections ahead of the first request.
+
+        Args:
+            connections: Concurrent pings, each holding its own connection
+        """
+        client = cls.get_client()
+        await asyncio.gather(*(client.ping() for _ in range(connections)))
+        logger.info("redis_pool_warmed", connections=connections)
+
     @classmethod
     async def health_check(cls) -> dict[str, Any]:
         """
@@ -62,8 +145,6 @@ class RedisClient:
         Returns:
             dict with status and server info
         """
-        import time
-
         try:
             start = time.perf_counter()
             client = cls.get_client()
@@ -106,18 +187,36 @@ class RedisClient:
         Returns:
             Cached value or default
         """
-        import json
-
         client = cls.get_client()
         value = await client.get(key)
 
         if value is None:
             return default
 
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            return value
+        return _decode_cached(value)
+
+    @classmethod
+    async def mget_cached(
+        cls,
+        keys: list[str],
+        default: Any = None,
+    ) -> list[Any]:
+        """
+        Get multiple cached values in a single round-trip.
+
+        Args:
+            keys: Cache keys
+            default: Default value for keys not found
+
+        Returns:
+            Cached values (or default) in the same order as keys
+        """
+        if not keys:
+            return []
+
+        client = cls.get_client()
+        values = await client.mget(keys)
+        return [default if value is None else _decode_cached(value) for value in values]
 
     @classmethod
     async def set_cached(
@@ -131,20 +230,36 @@ class RedisClient:
 
         Args:
             key: Cache key
-            value: Value to cache (will be JSON serialized)
+            value: Value to cache (strings stored raw, other values as JSON)
             ttl_seconds: Time to live in seconds
 
         Returns:
             True if successful
         """
-        import json
-
         client = cls.get_client()
+        return await client.setex(key, ttl_seconds, _encode_cached(value))
+
+    @classmethod
+    async def set_cached_many(
+        cls,
+        items: dict[str, tuple[Any, int]],
+    ) -> None:
+        """
+        Set multiple cached values in a single round-trip.
 
-        if isinstance(value, (dict, list)):
-            value = json.dumps(value)
+        Prefer this over calling set_cached in a loop.
 
-        return await client.setex(key, ttl_seconds, value)
+        Args:
+            items: Cache key to (value, ttl_seconds)
+        """
+        if not items:
+            return
+
+        client = cls.get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for key, (value, ttl_seconds) in items.items():
+                pipe.setex(key, ttl_seconds, _encode_cached(value))
+            await pipe.execute()
 
     @classmethod
     async def delete_cached(cls, key: str) -> bool:
@@ -164,13 +279,19 @@ class RedisClient:
             Number of keys deleted
         """
         client = cls.get_client()
-        keys = []
-        async for key in client.scan_iter(match=pattern):
-            keys.append(key)
+        deleted = 0
+        batch: list[str] = []
 
-        if keys:
-            return await client.delete(*keys)
-        return 0
+        # Stream keys in bounded batches; UNLINK frees memory off the main thread
+        async for key in client.scan_iter(match=pattern, count=_DELETE_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= _DELETE_BATCH_SIZE:
+                deleted += await client.unlink(*batch)
+                batch.clear()
+
+        if batch:
+            deleted += await client.unlink(*batch)
+        return deleted
 
     # =========================================================================
     # Rate Limiting
@@ -194,13 +315,11 @@ class RedisClient:
         Returns:
             Tuple of (allowed: bool, remaining: int)
         """
-        client = cls.get_client()
-
-        # Use sliding window counter
-        current = await client.incr(key)
+        if cls._rate_limit_script is None:
+            cls._rate_limit_script = cls.get_client().register_script(_RATE_LIMIT_LUA)
 
-        if current == 1:
-            await client.expire(key, window_seconds)
+        # Fixed window counter: INCR + first-hit EXPIRE in one atomic round-trip
+        current = int(await cls._rate_limit_script(keys=[key], args=[window_seconds]))
 
         remaining = max(0, max_requests - current)
         allowed = current <= max_requests
@@ -229,16 +348,20 @@ async def redis_lock(
     """
     Distributed lock using Redis.
 
+    Blocking waiters sleep on a per-lock wait list with BLPOP and are woken
+    by the holder's release instead of polling. At most _MAX_LOCK_WAITERS
+    waiters per process sit in BLPOP; the rest queue in-process, without
+    a connection.
+
     Usage:
         async with redis_lock("my-resource") as acquired:
             if acquired:
                 # Do work with lock
                 pass
     """
-    import uuid
-
     client = RedisClient.get_client()
     lock_key = f"lock:{key}"
+    wait_key = f"lock:wait:{key}"
     lock_value = str(uuid.uuid4())
 
     try:
@@ -251,24 +374,40 @@ async def redis_lock(
         )
 
         if not acquired and blocking:
-            # Wait and retry
-            import asyncio
+            if RedisClient._lock_wait_slots is None:
+                RedisClient._lock_wait_slots = asyncio.Semaphore(_MAX_LOCK_WAITERS)
+            wait_slots = RedisClient._lock_wait_slots
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout_seconds
+
+            while not acquired:
+                try:
+                    await asyncio.wait_for(wait_slots.acquire(), deadline - loop.time())
+                except TimeoutError:
+                    break
+
+                try:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+
+                    # Wake on release; the slice bounds the wait if the holder's
+                    # lock expires without an explicit release.
+                    await client.blpop([wait_key], timeout=min(remaining, _LOCK_WAIT_SLICE_SECONDS))
+                finally:
+                    wait_slots.release()
 
-            for _ in range(timeout_seconds * 10):
-                await asyncio.sleep(0.1)
                 acquired = await client.set(
                     lock_key,
                     lock_value,
                     nx=True,
                     ex=timeout_seconds,
                 )
-                if acquired:
-                    break
 
         yield bool(acquired)
 
     finally:
-        # Release lock only if we own it
-        current = await client.get(lock_key)
-        if current == lock_value:
-            await client.delete(lock_key)
+        # Release lock only if we own it, then wake one waiter (atomic CAS)
+        if RedisClient._unlock_script is None:
+            RedisClient._unlock_script = client.register_script(_UNLOCK_LUA)
+        await RedisClient._unlock_script(keys=[lock_key, wait_key], args=[lock_value])
@@ -23,15 +23,18 @@ Usage:
     print(response.content)
 """
 
+from shared.llm.cache import LLMCache, MemoryCacheBackend, get_llm_cache, set_llm_cache
 from shared.llm.claude import ClaudeProvider
-from shared.llm.ollama import OllamaProvider
+from shared.llm.ollama import CircuitOpenError, OllamaProvider
 from shared.llm.provider import (
     LLMMessage,
     LLMProvider,
     LLMResponse,
     LLMUsage,
+    close_llm_provider,
     get_llm_provider,
     set_llm_provider,
+    warm_up_llm_provider,
 )
 
 
@@ -41,9 +44,17 @@ __all__ = [
     "LLMMessage",
     "LLMResponse",
     "LLMUsage",
+    "close_llm_provider",
     "get_llm_provider",
     "set_llm_provider",
+    "warm_up_llm_provider",
+    # Response cache
+    "LLMCache",
+    "MemoryCacheBackend",
+    "get_llm_cache",
+    "set_llm_cache",
     # Providers
     "ClaudeProvider",
     "OllamaProvider",
+    "CircuitOpenError",
 ]
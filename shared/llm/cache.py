@@ -0,0 +1,272 @@
+"""
+LLM Response Cache
+==================
+
+Content-addressed cache for deterministic (temperature 0) completions.
+
+An identical request at temperature 0 yields the same output, so a stored
+response can be returned without a network round-trip or token spend.
+
+Version: 0.1.0
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
+
+import orjson
+
+from shared.database.redis import RedisClient
+from shared.llm.provider import LLMResponse
+from shared.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_DEFAULT_TTL_SECONDS = 86400
+_DEFAULT_MEMORY_ENTRIES = 1024
+
+
+class CacheBackend(Protocol):
+    """Storage for serialized LLM responses."""
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored value, or None on a miss."""
+        ...
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int) -> None:
+        """Store a value for ttl_seconds."""
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU backend, bounded by entry count."""
+
+    def __init__(self, max_entries: int = _DEFAULT_MEMORY_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class RedisCacheBackend:
+    """Redis backend, shared across processes and replicas."""
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        cached = await RedisClient.get_cached(key)
+        return cached if isinstance(cached, dict) else None
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int) -> None:
+        await RedisClient.set_cached(key, value, ttl_seconds=ttl_seconds)
+
+
+class LLMCache:
+    """
+    Response cache for deterministic completions.
+
+    Cache failures are logged and treated as misses; they never fail a
+    completion.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend (default: Redis)
+            ttl_seconds: Lifetime of stored responses
+        """
+        self._backend = backend or RedisCacheBackend()
+        self._ttl_seconds = ttl_seconds
+        self._inflight: dict[str, asyncio.Future[LLMResponse]] = {}
+
+    @staticmethod
+    def key(provider: str, request: dict[str, Any], temperature: float) -> str | None:
+        """
+        Build a content-addressed key for a provider request.
+
+        Args:
+            provider: Provider name, used as a key namespace
+            request: Request payload as sent to the provider
+            temperature: Sampling temperature of the request
+
+        Returns:
+            Cache key, or None when the request is not deterministic
+        """
+        if temperature != 0:
+            return None
+
+        digest = hashlib.blake2b(
+            orjson.dumps(request, option=orjson.OPT_SORT_KEYS),
+            digest_size=32,
+        ).hexdigest()
+        return f"llm:{provider}:{digest}"
+
+    async def get(self, key: str) -> LLMResponse | None:
+        """
+        Look up a stored response.
+
+        A hit is reported with zero cost, since no tokens were billed.
+
+        Args:
+            key: Key from LLMCache.key()
+
+        Returns:
+            Cached LLMResponse, or None on a miss
+        """
+        start_time = time.perf_counter()
+        try:
+            cached = await self._backend.get(key)
+        except Exception as e:
+            logger.warning("llm_cache_read_failed", error=str(e))
+            return None
+
+        if cached is None:
+            return None
+
+        logger.debug("llm_cache_hit", key=key)
+        return _without_cost(LLMResponse(**cached), start_time)
+
+    async def get_or_create(
+        self,
+        key: str,
+        create: Callable[[], Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        """
+        Return the stored response, or create and store it.
+
+        Concurrent callers for a key that is already being created await
+        the same result instead of issuing their own request; like cache
+        hits, they receive it with zero cost.
+
+        Args:
+            key: Key from LLMCache.key()
+            create: Coroutine function performing the completion
+
+        Returns:
+            Cached or newly created LLMResponse
+        """
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            cached = await self.get(key)
+            if cached is not None:
+                return cached
+            # Another caller may have started while the store was read
+            inflight = self._inflight.get(key)
+
+        if inflight is not None:
+            logger.debug("llm_cache_coalesced", key=key)
+            start_time = time.perf_counter()
+            # Shield so a cancelled waiter does not cancel the shared request
+            return _without_cost(await asyncio.shield(inflight), start_time)
+
+        # The request runs detached from the caller that started it, so
+        # cancelling that caller does not cancel the waiters' shared result
+        task = asyncio.ensure_future(self._create_and_store(key, create))
+        task.add_done_callback(_retrieve_exception)
+        self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _create_and_store(
+        self,
+        key: str,
+        create: Callable[[], Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        """Create a response and store it, staying in-flight until it is stored."""
+        try:
+            response = await create()
+            await self.set(key, response)
+            return response
+        finally:
+            del self._inflight[key]
+
+    async def set(self, key: str, response: LLMResponse) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from LLMCache.key()
+            response: Response to store
+        """
+        try:
+            await self._backend.set(
+                key,
+                response.model_dump(mode="json", exclude={"raw_response"}),
+                self._ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning("llm_cache_write_failed", error=str(e))
+
+
+def _retrieve_exception(task: asyncio.Future[LLMResponse]) -> None:
+    """Mark a failure retrieved; with no callers left asyncio would log it as unhandled."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _without_cost(response: LLMResponse, start_time: float) -> LLMResponse:
+    """Copy of a reused response with zero cost and the caller's own latency."""
+    usage = response.usage.model_copy(
+        update={"input_cost": 0.0, "output_cost": 0.0, "total_cost": 0.0}
+    )
+    return response.model_copy(
+        update={"usage": usage, "latency_ms": (time.perf_counter() - start_time) * 1000}
+    )
+
+
+# Global cache instance
+_cache: LLMCache | None = None
+
+
+def get_llm_cache() -> LLMCache:
+    """
+    Get the shared response cache.
+
+    Creates a Redis-backed cache on first call.
+
+    Returns:
+        LLMCache instance
+    """
+    global _cache
+
+    if _cache is None:
+        _cache = LLMCache()
+
+    return _cache
+
+
+def set_llm_cache(cache: LLMCache) -> None:
+    """
+    Set a custom response cache.
+
+    Useful for testing or an in-process backend.
+
+    Args:
+        cache: LLMCache instance to use
+    """
+    global _cache
+    _cache = cache
@@ -7,18 +7,16 @@ Anthropic Claude API implementation.
 Version: 0.1.0
 """
 
+import asyncio
+import logging
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import anthropic
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
 from shared.config import settings
+from shared.llm.cache import LLMCache, get_llm_cache
 from shared.llm.provider import LLMMessage, LLMProvider, LLMResponse, LLMUsage
 from shared.logging import get_logger
 
@@ -32,6 +30,11 @@ CLAUDE_PRICING = {
     "claude-3-opus-20240229": {"input": 15.00, "output": 75.00},
     "claude-3-haiku-20240307": {"input": 0.25, "output": 1.25},
 }
+_DEFAULT_PRICING = {"input": 3.00, "output": 15.00}
+
+# Per-token costs derived once from the per-1M pricing above
+_INPUT_COST_PER_TOKEN = {model: p["input"] / 1_000_000 for model, p in CLAUDE_PRICING.items()}
+_OUTPUT_COST_PER_TOKEN = {model: p["output"] / 1_000_000 for model, p in CLAUDE_PRICING.items()}
 
 
 class ClaudeProvider(LLMProvider):
@@ -56,6 +59,12 @@ class ClaudeProvider(LLMProvider):
         self._api_key = api_key or settings.llm.claude.api_key.get_secret_value()
         self._model = model or settings.llm.claude.model
         self._max_tokens = settings.llm.claude.max_tokens
+        self._input_cost_per_token = _INPUT_COST_PER_TOKEN.get(
+            self._model, _DEFAULT_PRICING["input"] / 1_000_000
+        )
+        self._output_cost_per_token = _OUTPUT_COST_PER_TOKEN.get(
+            self._model, _DEFAULT_PRICING["output"] / 1_000_000
+        )
 
         if not self._api_key:
             raise ValueError("Anthropic API key not configured")
@@ -72,22 +81,13 @@ class ClaudeProvider(LLMProvider):
     def model(self) -> str:
         return self._model
 
-    @retry(
-        retry=retry_if_exception_type((anthropic.RateLimitError, anthropic.APIConnectionError)),
-        stop=stop_after_attempt(settings.llm.max_retries),
-        wait=wait_exponential(multiplier=1, min=2, max=60),
-        before_sleep=lambda retry_state: logger.warning(
-            "claude_retry",
-            attempt=retry_state.attempt_number,
-            wait=retry_state.next_action.sleep,  # type: ignore[union-attr]
-        ),
-    )
     async def complete(
         self,
         messages: list[LLMMessage],
         temperature: float | None = None,
         max_tokens: int | None = None,
         stop_sequences: list[str] | None = None,
+        cache: bool = False,
     ) -> LLMResponse:
         """
         Generate a completion using Claude.
@@ -97,72 +97,43 @@ class ClaudeProvider(LLMProvider):
             temperature: Sampling temperature (default from settings)
             max_tokens: Max tokens to generate (default from settings)
             stop_sequences: Optional stop sequences
+            cache: Reuse a stored response for an identical request. Only
+                applies at temperature 0, where output is deterministic.
 
         Returns:
             LLMResponse with generated content
         """
         start_time = time.perf_counter()
+        kwargs = self._build_request(messages, temperature, max_tokens, stop_sequences)
 
-        # Extract system message if present
-        system_message = None
-        api_messages = []
-
-        for msg in messages:
-            msg_dict = msg.to_dict()
-            if msg_dict["role"] == "system":
-                system_message = msg_dict["content"]
-            else:
-                api_messages.append(msg_dict)
-
-        # Build request kwargs
-        kwargs: dict[str, Any] = {
-            "model": self._model,
-            "messages": api_messages,
-            "max_tokens": max_tokens or self._max_tokens,
-            "temperature": temperature if temperature is not None else settings.llm.temperature,
-        }
-
-        if system_message:
-            kwargs["system"] = system_message
+        cache_key = LLMCache.key(self.name, kwargs, kwargs["temperature"]) if cache else None
+        if cache_key is not None:
+            return await get_llm_cache().get_or_create(
+                cache_key, lambda: self._complete_request(kwargs, start_time)
+            )
 
-        if stop_sequences:
-            kwargs["stop_sequences"] = stop_sequences
+        return await self._complete_request(kwargs, start_time)
 
+    async def _complete_request(self, kwargs: dict[str, Any], start_time: float) -> LLMResponse:
+        """Send a completion request to the Messages API and build the LLMResponse."""
         try:
-            response = await self._client.messages.create(**kwargs)
+            response = await self._create_message(kwargs)
 
             latency_ms = (time.perf_counter() - start_time) * 1000
 
             # Extract content
-            content = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    content += block.text
-
-            # Calculate costs
-            pricing = CLAUDE_PRICING.get(
-                self._model,
-                {"input": 3.00, "output": 15.00},
-            )
-            input_cost = (response.usage.input_tokens / 1_000_000) * pricing["input"]
-            output_cost = (response.usage.output_tokens / 1_000_000) * pricing["output"]
-
-            usage = LLMUsage(
-                prompt_tokens=response.usage.input_tokens,
-                completion_tokens=response.usage.output_tokens,
-                total_tokens=response.usage.input_tokens + response.usage.output_tokens,
-                input_cost=input_cost,
-                output_cost=output_cost,
-                total_cost=input_cost + output_cost,
-            )
+            content = "".join(block.text for block in response.content if hasattr(block, "text"))
 
-            logger.debug(
-                "claude_completion",
-                model=self._model,
-                tokens=usage.total_tokens,
-                cost=usage.total_cost,
-                latency_ms=round(latency_ms, 2),
-            )
+            usage = self._usage(response.usage)
+
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "claude_completion",
+                    model=self._model,
+                    tokens=usage.total_tokens,
+                    cost=usage.total_cost,
+                    latency_ms=round(latency_ms, 2),
+                )
 
             return LLMResponse(
                 content=content,
@@ -183,6 +154,117 @@ class ClaudeProvider(LLMProvider):
             logger.error("claude_error", error=str(e), error_type=type(e).__name__)
             raise
 
+    async def complete_stream(
+        self,
+        messages: list[LLMMessage],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion from Claude as text deltas.
+
+        Args:
+            messages: Conversation messages
+            temperature: Sampling temperature (default from settings)
+            max_tokens: Max tokens to generate (default from settings)
+            stop_sequences: Optional stop sequences
+
+        Yields:
+            Text chunks as they are generated
+        """
+        start_time = time.perf_counter()
+        kwargs = self._build_request(messages, temperature, max_tokens, stop_sequences)
+
+        try:
+            async with self._client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                final_message = await stream.get_final_message()
+        except Exception as e:
+            logger.error("claude_error", error=str(e), error_type=type(e).__name__)
+            raise
+
+        if logger.is_enabled_for(logging.DEBUG):
+            usage = self._usage(final_message.usage)
+            logger.debug(
+                "claude_completion_streamed",
+                model=self._model,
+                tokens=usage.total_tokens,
+                cost=usage.total_cost,
+                latency_ms=round((time.perf_counter() - start_time) * 1000, 2),
+            )
+
+    def _build_request(
+        self,
+        messages: list[LLMMessage],
+        temperature: float | None,
+        max_tokens: int | None,
+        stop_sequences: list[str] | None,
+    ) -> dict[str, Any]:
+        """Build Messages API kwargs, lifting any system message out of the list."""
+        system_message = None
+        api_messages = []
+
+        for msg in messages:
+            if msg.role == "system":
+                system_message = msg.content
+            else:
+                api_messages.append({"role": msg.role, "content": msg.content})
+
+        kwargs: dict[str, Any] = {
+            "model": self._model,
+            "messages": api_messages,
+            "max_tokens": max_tokens or self._max_tokens,
+            "temperature": temperature if temperature is not None else settings.llm.temperature,
+        }
+
+        if system_message:
+            kwargs["system"] = system_message
+
+        if stop_sequences:
+            kwargs["stop_sequences"] = stop_sequences
+
+        return kwargs
+
+    def _usage(self, api_usage: Any) -> LLMUsage:
+        """Convert API token usage into LLMUsage with costs."""
+        input_cost = api_usage.input_tokens * self._input_cost_per_token
+        output_cost = api_usage.output_tokens * self._output_cost_per_token
+
+        return LLMUsage(
+            prompt_tokens=api_usage.input_tokens,
+            completion_tokens=api_usage.output_tokens,
+            total_tokens=api_usage.input_tokens + api_usage.output_tokens,
+            input_cost=input_cost,
+            output_cost=output_cost,
+            total_cost=input_cost + output_cost,
+        )
+
+    async def _create_message(self, kwargs: dict[str, Any]) -> Any:
+        """
+        Call the Messages API, retrying rate limits and connection errors.
+
+        Waits 2s, 4s, 8s, ... (capped at 60s) between attempts.
+        """
+        max_attempts = max(1, settings.llm.max_retries)
+        attempt = 0
+        while True:
+            try:
+                return await self._client.messages.create(**kwargs)
+            except (anthropic.RateLimitError, anthropic.APIConnectionError):
+                attempt += 1
+                if attempt >= max_attempts:
+                    raise
+                wait = min(60, 2**attempt)
+                logger.warning("claude_retry", attempt=attempt, wait=wait)
+                await asyncio.sleep(wait)
+
+    async def warm_up(self) -> None:
+        """Open an API connection with an unbilled models listing."""
+        await self._client.models.list(limit=1)
+        logger.info("claude_connection_warmed", model=self._model)
+
     async def health_check(self) -> dict[str, Any]:
         """
         Check Claude API health.
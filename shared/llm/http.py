@@ -0,0 +1,105 @@
+"""
+Shared HTTP Clients
+===================
+
+Process-wide pooled httpx clients for LLM backends, one per base URL.
+
+Providers and health checks for the same host share one connection pool
+instead of each opening their own. Clients are reference counted:
+get_client() takes a reference and release_client() drops it, closing
+the client only when the last holder releases it. Never call aclose()
+on a shared client directly — other holders would be left with a closed
+pool. close_clients() closes everything at application shutdown.
+
+Counts belong to client objects, not base URLs: if a client is replaced
+after being closed, late releases of the old one never touch the new
+one.
+
+Version: 0.1.0
+"""
+
+from typing import Any
+
+import httpx
+
+from shared.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Access happens only from the event loop thread without awaiting, so no
+# lock is needed around these
+_clients: dict[str, httpx.AsyncClient] = {}
+_options: dict[str, dict[str, Any]] = {}
+_refcounts: dict[httpx.AsyncClient, int] = {}
+
+
+def get_client(base_url: str, timeout: httpx.Timeout, **client_kwargs: Any) -> httpx.AsyncClient:
+    """
+    Get the shared client for a base URL, creating it on first use.
+
+    The first caller's options configure the pool; later callers for the
+    same base URL share it as-is, and a warning is logged if they asked
+    for different options.
+
+    Args:
+        base_url: Backend base URL
+        timeout: Default request timeout
+        **client_kwargs: Extra httpx.AsyncClient options (limits, http2, headers)
+
+    Returns:
+        Pooled httpx.AsyncClient; pass it to release_client() when done
+    """
+    options = {"timeout": timeout, **client_kwargs}
+    client = _clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(base_url=base_url, **options)
+        _clients[base_url] = client
+        _options[base_url] = options
+        _refcounts[client] = 0
+        logger.debug("http_client_created", base_url=base_url)
+    elif options != _options[base_url]:
+        logger.warning(
+            "http_client_options_ignored",
+            base_url=base_url,
+            differing=sorted(k for k in options if options[k] != _options[base_url].get(k)),
+        )
+
+    _refcounts[client] += 1
+    return client
+
+
+async def release_client(client: httpx.AsyncClient) -> None:
+    """
+    Drop a reference taken by get_client(), closing the client when unused.
+
+    Args:
+        client: Client returned by get_client()
+    """
+    if client not in _refcounts:
+        # Already closed by close_clients()
+        return
+
+    _refcounts[client] -= 1
+    if _refcounts[client] > 0:
+        return
+
+    del _refcounts[client]
+    base_url = str(client.base_url)
+    for url, shared in list(_clients.items()):
+        if shared is client:
+            del _clients[url]
+            del _options[url]
+    await client.aclose()
+    logger.debug("http_client_closed", base_url=base_url)
+
+
+async def close_clients() -> None:
+    """Close all shared clients regardless of references (application shutdown)."""
+    clients = list(_refcounts)
+    _clients.clear()
+    _options.clear()
+    _refcounts.clear()
+
+    for client in clients:
+        await client.aclose()
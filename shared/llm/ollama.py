@@ -7,10 +7,14 @@ Local LLM provider using Ollama for cost optimization.
 Version: 0.1.0
 """
 
+import asyncio
+import logging
 import time
-from typing import Any
+from collections.abc import AsyncIterator, Callable
+from typing import Any, ClassVar
 
 import httpx
+import orjson
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -19,12 +23,26 @@ from tenacity import (
 )
 
 from shared.config import settings
+from shared.llm.cache import LLMCache, get_llm_cache
+from shared.llm.http import get_client, release_client
 from shared.llm.provider import LLMMessage, LLMProvider, LLMResponse, LLMUsage
 from shared.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Longest silence tolerated between /api/pull progress events
+_PULL_READ_TIMEOUT_SECONDS = 120.0
+
+# Circuit breaker backoff after consecutive connection failures
+_CIRCUIT_MAX_OPEN_SECONDS = 10.0
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without a network call while the Ollama server is known to be down."""
+
 
 class OllamaProvider(LLMProvider):
     """
@@ -35,8 +53,16 @@ class OllamaProvider(LLMProvider):
     - Mistral
     - CodeLlama
     - etc.
+
+    Connection failures trip a per-host circuit breaker: callers fail fast
+    with CircuitOpenError for a backoff window (1s, 2s, 4s, ... capped at
+    10s) instead of each one waiting through its own retries.
     """
 
+    # Circuit breaker state per host, shared by all instances
+    _circuit_open_until: ClassVar[dict[str, float]] = {}
+    _connect_failures: ClassVar[dict[str, int]] = {}
+
     def __init__(
         self,
         host: str | None = None,
@@ -55,12 +81,23 @@ class OllamaProvider(LLMProvider):
         self._model = model or settings.llm.ollama.model
         self._timeout = timeout or settings.llm.timeout_seconds
 
-        # HTTP client for API calls
-        self._client = httpx.AsyncClient(
-            base_url=self._host,
-            timeout=httpx.Timeout(self._timeout),
+        # Shared pooled HTTP client for API calls; HTTP/2 is negotiated when the
+        # server is reached over TLS (e.g. behind a reverse proxy)
+        ollama = settings.llm.ollama
+        self._client = get_client(
+            self._host,
+            timeout=httpx.Timeout(self._timeout, connect=ollama.http_connect_timeout),
+            limits=httpx.Limits(
+                max_connections=ollama.http_max_connections,
+                max_keepalive_connections=ollama.http_max_keepalive,
+                keepalive_expiry=ollama.http_keepalive_expiry,
+            ),
+            http2=True,
+            headers={"User-Agent": "civium/0.1"},
         )
 
+        self._keepalive_task: asyncio.Task[None] | None = None
+
         logger.debug(
             "ollama_provider_initialized",
             host=self._host,
@@ -75,32 +112,14 @@ class OllamaProvider(LLMProvider):
     def model(self) -> str:
         return self._model
 
-    def _format_messages(self, messages: list[LLMMessage]) -> str:
-        """
-        Format messages into a prompt string.
-
-        Ollama's chat API expects a specific format, but we can also
-        use the generate API with a formatted prompt.
-        """
-        formatted = []
-
-        for msg in messages:
-            msg_dict = msg.to_dict()
-            role = msg_dict["role"]
-            content = msg_dict["content"]
-
-            if role == "system":
-                formatted.append(f"System: {content}")
-            elif role == "user":
-                formatted.append(f"Human: {content}")
-            elif role == "assistant":
-                formatted.append(f"Assistant: {content}")
-
-        formatted.append("Assistant:")
-        return "\n\n".join(formatted)
+    @property
+    def max_concurrency(self) -> int:
+        """Match the server's parallel decode slots so batches share weights."""
+        return settings.llm.ollama.num_parallel
 
     @retry(
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException)),
+        # Connection refusals are left to the circuit breaker rather than retried
+        retry=retry_if_exception_type((httpx.TimeoutException, httpx.RemoteProtocolError)),
         stop=stop_after_attempt(settings.llm.max_retries),
         wait=wait_exponential(multiplier=1, min=2, max=30),
         before_sleep=lambda retry_state: logger.warning(
@@ -114,6 +133,7 @@ class OllamaProvider(LLMProvider):
         temperature: float | None = None,
         max_tokens: int | None = None,
         stop_sequences: list[str] | None = None,
+        cache: bool = False,
     ) -> LLMResponse:
         """
         Generate a completion using Ollama.
@@ -123,74 +143,49 @@ class OllamaProvider(LLMProvider):
             temperature: Sampling temperature
             max_tokens: Max tokens (num_predict in Ollama)
             stop_sequences: Stop sequences
+            cache: Reuse a stored response for an identical request. Only
+                applies at temperature 0, where output is deterministic.
 
         Returns:
             LLMResponse with generated content
         """
         start_time = time.perf_counter()
+        request = self._build_request(messages, temperature, max_tokens, stop_sequences)
 
-        # Use chat API for better multi-turn support
-        chat_messages = []
-        for msg in messages:
-            msg_dict = msg.to_dict()
-            chat_messages.append(
-                {
-                    "role": msg_dict["role"],
-                    "content": msg_dict["content"],
-                }
+        cache_key = (
+            LLMCache.key(self.name, request, request["options"]["temperature"]) if cache else None
+        )
+        if cache_key is not None:
+            return await get_llm_cache().get_or_create(
+                cache_key, lambda: self._complete_request(request, start_time)
             )
 
-        # Build options
-        options: dict[str, Any] = {}
-        if temperature is not None:
-            options["temperature"] = temperature
-        else:
-            options["temperature"] = settings.llm.temperature
-
-        if max_tokens is not None:
-            options["num_predict"] = max_tokens
-
-        if stop_sequences:
-            options["stop"] = stop_sequences
+        return await self._complete_request(request, start_time)
 
+    async def _complete_request(self, request: dict[str, Any], start_time: float) -> LLMResponse:
+        """Send a completion request to /api/chat and build the LLMResponse."""
         try:
-            response = await self._client.post(
-                "/api/chat",
-                json={
-                    "model": self._model,
-                    "messages": chat_messages,
-                    "stream": False,
-                    "options": options,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+            # Stream and aggregate so long generations never sit idle past
+            # the read timeout and no single large body is parsed at the end
+            content_parts: list[str] = []
+            data: dict[str, Any] = {}
+            async for chunk in self._chat_chunks(request):
+                content_parts.append(chunk.get("message", {}).get("content", ""))
+                if chunk.get("done"):
+                    data = chunk
 
             latency_ms = (time.perf_counter() - start_time) * 1000
 
-            # Extract content
-            content = data.get("message", {}).get("content", "")
-
-            # Token usage (Ollama provides these in response)
-            prompt_tokens = data.get("prompt_eval_count", 0)
-            completion_tokens = data.get("eval_count", 0)
-
-            usage = LLMUsage(
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=prompt_tokens + completion_tokens,
-                # Local models have no API cost
-                input_cost=0.0,
-                output_cost=0.0,
-                total_cost=0.0,
-            )
+            content = "".join(content_parts)
+            usage = self._usage(data)
 
-            logger.debug(
-                "ollama_completion",
-                model=self._model,
-                tokens=usage.total_tokens,
-                latency_ms=round(latency_ms, 2),
-            )
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "ollama_completion",
+                    model=self._model,
+                    tokens=usage.total_tokens,
+                    latency_ms=round(latency_ms, 2),
+                )
 
             return LLMResponse(
                 content=content,
@@ -213,6 +208,178 @@ class OllamaProvider(LLMProvider):
             logger.error("ollama_error", error=str(e), error_type=type(e).__name__)
             raise
 
+    async def complete_stream(
+        self,
+        messages: list[LLMMessage],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion from Ollama as text deltas.
+
+        Args:
+            messages: Conversation messages
+            temperature: Sampling temperature
+            max_tokens: Max tokens (num_predict in Ollama)
+            stop_sequences: Stop sequences
+
+        Yields:
+            Text chunks as they are generated
+        """
+        start_time = time.perf_counter()
+        request = self._build_request(messages, temperature, max_tokens, stop_sequences)
+
+        data: dict[str, Any] = {}
+        try:
+            async for chunk in self._chat_chunks(request):
+                text = chunk.get("message", {}).get("content", "")
+                if text:
+                    yield text
+                if chunk.get("done"):
+                    data = chunk
+        except Exception as e:
+            logger.error("ollama_error", error=str(e), error_type=type(e).__name__)
+            raise
+
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "ollama_completion_streamed",
+                model=self._model,
+                tokens=self._usage(data).total_tokens,
+                latency_ms=round((time.perf_counter() - start_time) * 1000, 2),
+            )
+
+    def _build_request(
+        self,
+        messages: list[LLMMessage],
+        temperature: float | None,
+        max_tokens: int | None,
+        stop_sequences: list[str] | None,
+    ) -> dict[str, Any]:
+        """Build a streaming /api/chat request body."""
+        options: dict[str, Any] = {
+            "temperature": temperature if temperature is not None else settings.llm.temperature,
+        }
+
+        if max_tokens is not None:
+            options["num_predict"] = max_tokens
+
+        if stop_sequences:
+            options["stop"] = stop_sequences
+
+        # Use chat API for better multi-turn support
+        return {
+            "model": self._model,
+            "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
+            "stream": True,
+            "options": options,
+        }
+
+    async def _chat_chunks(self, request: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """
+        POST to /api/chat and yield each NDJSON chunk as it arrives.
+
+        Raises:
+            httpx.HTTPStatusError: If the server rejects the request
+            RuntimeError: If the server reports an error mid-stream
+            CircuitOpenError: If the server recently refused connections
+        """
+        if self.circuit_open:
+            raise CircuitOpenError(f"Ollama at {self._host} is unavailable")
+
+        try:
+            async with self._client.stream(
+                "POST",
+                "/api/chat",
+                content=orjson.dumps(request),
+                headers=_JSON_HEADERS,
+            ) as response:
+                self._record_connect_success()
+                if response.status_code != 200:
+                    response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    if "error" in chunk:
+                        raise RuntimeError(chunk["error"])
+                    yield chunk
+        except httpx.ConnectError:
+            self._record_connect_failure()
+            raise
+
+    @property
+    def circuit_open(self) -> bool:
+        """Whether calls are currently failing fast for this host."""
+        return time.monotonic() < self._circuit_open_until.get(self._host, 0.0)
+
+    def _record_connect_success(self) -> None:
+        """Close the circuit after a successful connection."""
+        if self._connect_failures.pop(self._host, None):
+            self._circuit_open_until.pop(self._host, None)
+            logger.info("ollama_circuit_closed", host=self._host)
+
+    def _record_connect_failure(self) -> None:
+        """Open the circuit for an exponentially growing window."""
+        failures = self._connect_failures.get(self._host, 0) + 1
+        self._connect_failures[self._host] = failures
+
+        open_seconds = min(_CIRCUIT_MAX_OPEN_SECONDS, 2.0 ** (failures - 1))
+        self._circuit_open_until[self._host] = time.monotonic() + open_seconds
+        logger.warning(
+            "ollama_circuit_opened",
+            host=self._host,
+            failures=failures,
+            open_seconds=open_seconds,
+        )
+
+    @staticmethod
+    def _usage(data: dict[str, Any]) -> LLMUsage:
+        """Token usage from the final chunk; local models have no API cost."""
+        prompt_tokens = data.get("prompt_eval_count", 0)
+        completion_tokens = data.get("eval_count", 0)
+
+        return LLMUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
+    async def warm_up(self) -> None:
+        """Connect to the server and keep the pooled connection alive."""
+        response = await self._client.get("/api/tags")
+        if response.status_code != 200:
+            response.raise_for_status()
+        self._record_connect_success()
+        self.start_keepalive()
+        logger.info("ollama_connection_warmed", host=self._host)
+
+    def start_keepalive(self, interval: float | None = None) -> None:
+        """
+        Ping the server in the background so idle connections are not expired.
+
+        Args:
+            interval: Seconds between pings (default: 80% of the keepalive expiry)
+        """
+        if self._keepalive_task is not None and not self._keepalive_task.done():
+            return
+
+        if interval is None:
+            interval = settings.llm.ollama.http_keepalive_expiry * 0.8
+        self._keepalive_task = asyncio.create_task(self._keepalive(interval))
+
+    async def _keepalive(self, interval: float) -> None:
+        """Background loop for start_keepalive(); ping failures are ignored."""
+        while True:
+            await asyncio.sleep(interval)
+            if self._client.is_closed:
+                return
+            try:
+                await self._client.get("/api/tags", timeout=2.0)
+            except httpx.HTTPError:
+                pass
+
     async def health_check(self) -> dict[str, Any]:
         """
         Check Ollama server health and model availability.
@@ -225,8 +392,9 @@ class OllamaProvider(LLMProvider):
 
             # Check if server is running
             response = await self._client.get("/api/tags")
-            response.raise_for_status()
-            data = response.json()
+            if response.status_code != 200:
+                response.raise_for_status()
+            data = orjson.loads(response.content)
 
             latency_ms = (time.perf_counter() - start) * 1000
 
@@ -234,11 +402,15 @@ class OllamaProvider(LLMProvider):
             models = [m["name"] for m in data.get("models", [])]
             model_available = any(self._model in m for m in models)
 
+            # A reachable server closes the circuit without waiting for a completion
+            self._record_connect_success()
+
             return {
                 "status": "healthy" if model_available else "degraded",
                 "provider": self.name,
                 "model": self._model,
                 "model_available": model_available,
+                "circuit_open": False,
                 "available_models": models[:5],  # First 5
                 "latency_ms": round(latency_ms, 2),
             }
@@ -269,19 +441,30 @@ class OllamaProvider(LLMProvider):
         """
         try:
             response = await self._client.get("/api/tags")
-            response.raise_for_status()
-            data = response.json()
+            if response.status_code != 200:
+                response.raise_for_status()
+            data = orjson.loads(response.content)
             return data.get("models", [])
         except Exception as e:
             logger.error("ollama_list_models_error", error=str(e))
             return []
 
-    async def pull_model(self, model_name: str) -> bool:
+    async def pull_model(
+        self,
+        model_name: str,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    ) -> bool:
         """
         Pull a model from Ollama library.
 
+        Progress is streamed, so there is no wall-clock limit on large
+        models; the pull is abandoned if the server goes silent for
+        longer than the read timeout.
+
         Args:
             model_name: Model to pull (e.g., "llama3.3:70b")
+            progress_callback: Called with each progress event
+                (status, digest, total, completed)
 
         Returns:
             True if successful
@@ -289,21 +472,37 @@ class OllamaProvider(LLMProvider):
         try:
             logger.info("ollama_pulling_model", model=model_name)
 
-            # This is a streaming endpoint, but we'll just wait for completion
-            response = await self._client.post(
+            async with self._client.stream(
+                "POST",
                 "/api/pull",
-                json={"name": model_name, "stream": False},
-                timeout=httpx.Timeout(600.0),  # 10 minute timeout for large models
-            )
-            response.raise_for_status()
-
-            logger.info("ollama_model_pulled", model=model_name)
-            return True
+                content=orjson.dumps({"name": model_name, "stream": True}),
+                headers=_JSON_HEADERS,
+                timeout=httpx.Timeout(self._timeout, read=_PULL_READ_TIMEOUT_SECONDS),
+            ) as response:
+                if response.status_code != 200:
+                    response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    event = orjson.loads(line)
+                    if "error" in event:
+                        raise RuntimeError(event["error"])
+                    if progress_callback is not None:
+                        progress_callback(event)
+                    if event.get("status") == "success":
+                        logger.info("ollama_model_pulled", model=model_name)
+                        return True
+
+            raise RuntimeError("Pull stream ended without success")
 
         except Exception as e:
             logger.error("ollama_pull_error", model=model_name, error=str(e))
             return False
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Release the shared HTTP client; call once per provider instance."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        await release_client(self._client)
@@ -7,10 +7,15 @@ OpenAI GPT API implementation (backup provider).
 Version: 0.1.0
 """
 
+import asyncio
+import logging
 import time
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 import openai
+import orjson
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -19,6 +24,7 @@ from tenacity import (
 )
 
 from shared.config import settings
+from shared.llm.cache import LLMCache, get_llm_cache
 from shared.llm.provider import LLMMessage, LLMProvider, LLMResponse, LLMUsage
 from shared.logging import get_logger
 
@@ -26,14 +32,26 @@ from shared.logging import get_logger
 logger = get_logger(__name__)
 
 # Pricing per 1M tokens (as of 2024)
-OPENAI_PRICING = {
-    "gpt-4-turbo-preview": {"input": 10.00, "output": 30.00},
-    "gpt-4-turbo": {"input": 10.00, "output": 30.00},
-    "gpt-4": {"input": 30.00, "output": 60.00},
-    "gpt-4o": {"input": 5.00, "output": 15.00},
-    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
-    "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
-}
+OPENAI_PRICING: Mapping[str, Mapping[str, float]] = MappingProxyType(
+    {
+        "gpt-4-turbo-preview": {"input": 10.00, "output": 30.00},
+        "gpt-4-turbo": {"input": 10.00, "output": 30.00},
+        "gpt-4": {"input": 30.00, "output": 60.00},
+        "gpt-4o": {"input": 5.00, "output": 15.00},
+        "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+        "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
+    }
+)
+_DEFAULT_PRICING = {"input": 10.00, "output": 30.00}
+
+# Per-token costs derived once from the per-1M pricing above
+_INPUT_COST_PER_TOKEN = {model: p["input"] / 1_000_000 for model, p in OPENAI_PRICING.items()}
+_OUTPUT_COST_PER_TOKEN = {model: p["output"] / 1_000_000 for model, p in OPENAI_PRICING.items()}
+
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+# Batch API requests are billed at half the synchronous price
+_BATCH_PRICE_FACTOR = 0.5
 
 
 class OpenAIProvider(LLMProvider):
@@ -57,6 +75,12 @@ class OpenAIProvider(LLMProvider):
         """
         self._api_key = api_key or settings.llm.openai.api_key.get_secret_value()
         self._model = model or settings.llm.openai.model
+        self._input_cost_per_token = _INPUT_COST_PER_TOKEN.get(
+            self._model, _DEFAULT_PRICING["input"] / 1_000_000
+        )
+        self._output_cost_per_token = _OUTPUT_COST_PER_TOKEN.get(
+            self._model, _DEFAULT_PRICING["output"] / 1_000_000
+        )
 
         if not self._api_key:
             raise ValueError("OpenAI API key not configured")
@@ -88,6 +112,7 @@ class OpenAIProvider(LLMProvider):
         temperature: float | None = None,
         max_tokens: int | None = None,
         stop_sequences: list[str] | None = None,
+        cache: bool = False,
     ) -> LLMResponse:
         """
         Generate a completion using OpenAI.
@@ -97,28 +122,25 @@ class OpenAIProvider(LLMProvider):
             temperature: Sampling temperature
             max_tokens: Max tokens to generate
             stop_sequences: Stop sequences
+            cache: Reuse a stored response for an identical request. Only
+                applies at temperature 0, where output is deterministic.
 
         Returns:
             LLMResponse with generated content
         """
         start_time = time.perf_counter()
+        kwargs = self._build_request(messages, temperature, max_tokens, stop_sequences)
 
-        # Convert messages to OpenAI format
-        api_messages = [msg.to_dict() for msg in messages]
-
-        # Build request kwargs
-        kwargs: dict[str, Any] = {
-            "model": self._model,
-            "messages": api_messages,
-            "temperature": temperature if temperature is not None else settings.llm.temperature,
-        }
-
-        if max_tokens:
-            kwargs["max_tokens"] = max_tokens
+        cache_key = LLMCache.key(self.name, kwargs, kwargs["temperature"]) if cache else None
+        if cache_key is not None:
+            return await get_llm_cache().get_or_create(
+                cache_key, lambda: self._complete_request(kwargs, start_time)
+            )
 
-        if stop_sequences:
-            kwargs["stop"] = stop_sequences
+        return await self._complete_request(kwargs, start_time)
 
+    async def _complete_request(self, kwargs: dict[str, Any], start_time: float) -> LLMResponse:
+        """Send a completion request to the Chat Completions API and build the LLMResponse."""
         try:
             response = await self._client.chat.completions.create(**kwargs)
 
@@ -127,34 +149,18 @@ class OpenAIProvider(LLMProvider):
             # Extract content
             content = response.choices[0].message.content or ""
 
-            # Calculate costs
-            pricing = OPENAI_PRICING.get(
-                self._model,
-                {"input": 10.00, "output": 30.00},
-            )
-
             prompt_tokens = response.usage.prompt_tokens if response.usage else 0
             completion_tokens = response.usage.completion_tokens if response.usage else 0
+            usage = self._usage(prompt_tokens, completion_tokens)
 
-            input_cost = (prompt_tokens / 1_000_000) * pricing["input"]
-            output_cost = (completion_tokens / 1_000_000) * pricing["output"]
-
-            usage = LLMUsage(
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=prompt_tokens + completion_tokens,
-                input_cost=input_cost,
-                output_cost=output_cost,
-                total_cost=input_cost + output_cost,
-            )
-
-            logger.debug(
-                "openai_completion",
-                model=self._model,
-                tokens=usage.total_tokens,
-                cost=usage.total_cost,
-                latency_ms=round(latency_ms, 2),
-            )
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "openai_completion",
+                    model=self._model,
+                    tokens=usage.total_tokens,
+                    cost=usage.total_cost,
+                    latency_ms=round(latency_ms, 2),
+                )
 
             return LLMResponse(
                 content=content,
@@ -175,6 +181,164 @@ class OpenAIProvider(LLMProvider):
             logger.error("openai_error", error=str(e), error_type=type(e).__name__)
             raise
 
+    async def submit_batch_job(
+        self,
+        messages_batch: list[list[LLMMessage]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+    ) -> str:
+        """
+        Submit completions to the OpenAI Batch API.
+
+        Batch jobs complete within 24 hours at half the synchronous price,
+        which suits offline evaluation and bulk classification.
+
+        Args:
+            messages_batch: One message list per completion
+            temperature: Sampling temperature
+            max_tokens: Max tokens to generate
+            stop_sequences: Stop sequences
+
+        Returns:
+            Batch job ID for wait_for_batch_job()
+        """
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": _BATCH_ENDPOINT,
+                    "body": self._build_request(messages, temperature, max_tokens, stop_sequences),
+                }
+            )
+            for index, messages in enumerate(messages_batch)
+        ]
+
+        batch_file = await self._client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await self._client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+
+        logger.info("openai_batch_submitted", batch_id=batch.id, requests=len(lines))
+        return batch.id
+
+    async def wait_for_batch_job(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0,
+    ) -> list[LLMResponse | None]:
+        """
+        Poll a batch job until it finishes and collect its responses.
+
+        Args:
+            batch_id: ID returned by submit_batch_job()
+            poll_interval: Seconds between status checks
+
+        Returns:
+            Responses in submission order; None where a request failed
+
+        Raises:
+            RuntimeError: If the job fails, expires, or is cancelled
+        """
+        batch = await self._client.batches.retrieve(batch_id)
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await self._client.batches.retrieve(batch_id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error("openai_batch_failed", batch_id=batch_id, status=batch.status)
+            raise RuntimeError(f"OpenAI batch {batch_id} ended with status {batch.status}")
+
+        output = await self._client.files.content(batch.output_file_id)
+
+        total = batch.request_counts.total if batch.request_counts else 0
+        results: list[LLMResponse | None] = [None] * total
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+
+            body = response["body"]
+            usage = body.get("usage") or {}
+            index = int(record["custom_id"])
+            if index >= len(results):
+                results.extend([None] * (index + 1 - len(results)))
+
+            results[index] = LLMResponse(
+                content=body["choices"][0]["message"]["content"] or "",
+                model=body["model"],
+                provider=self.name,
+                usage=self._usage(
+                    usage.get("prompt_tokens", 0),
+                    usage.get("completion_tokens", 0),
+                    price_factor=_BATCH_PRICE_FACTOR,
+                ),
+                finish_reason=body["choices"][0].get("finish_reason"),
+            )
+
+        logger.info(
+            "openai_batch_completed",
+            batch_id=batch_id,
+            succeeded=sum(result is not None for result in results),
+            requests=len(results),
+        )
+        return results
+
+    def _build_request(
+        self,
+        messages: list[LLMMessage],
+        temperature: float | None,
+        max_tokens: int | None,
+        stop_sequences: list[str] | None,
+    ) -> dict[str, Any]:
+        """Build Chat Completions kwargs."""
+        kwargs: dict[str, Any] = {
+            "model": self._model,
+            "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
+            "temperature": temperature if temperature is not None else settings.llm.temperature,
+        }
+
+        if max_tokens:
+            kwargs["max_tokens"] = max_tokens
+
+        if stop_sequences:
+            kwargs["stop"] = stop_sequences
+
+        return kwargs
+
+    def _usage(
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        price_factor: float = 1.0,
+    ) -> LLMUsage:
+        """Convert token counts into LLMUsage with costs."""
+        input_cost = prompt_tokens * self._input_cost_per_token * price_factor
+        output_cost = completion_tokens * self._output_cost_per_token * price_factor
+
+        return LLMUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+            input_cost=input_cost,
+            output_cost=output_cost,
+            total_cost=input_cost + output_cost,
+        )
+
+    async def warm_up(self) -> None:
+        """Open an API connection with an unbilled models listing."""
+        await self._client.models.list()
+        logger.info("openai_connection_warmed", model=self._model)
+
     async def health_check(self) -> dict[str, Any]:
         """
         Check OpenAI API health.
@@ -7,11 +7,15 @@ Abstract base class and common models for LLM providers.
 Version: 0.1.0
 """
 
+import asyncio
+import re
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from shared.config import LLMProvider as LLMProviderEnum
 from shared.config import settings
@@ -20,6 +24,12 @@ from shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+_JSON_INSTRUCTION = "Respond ONLY with valid JSON. No markdown, no explanation."
+_JSON_INSTRUCTION_SUFFIX = "\n\n" + _JSON_INSTRUCTION
+
+# Optional ```/```json opening fence and optional closing fence
+_MARKDOWN_FENCE_RE = re.compile(r"^(?:```(?:json)?)?(.*?)(?:```)?$", re.DOTALL)
+
 
 class MessageRole(str, Enum):
     """Message role in conversation."""
@@ -30,15 +40,27 @@ class MessageRole(str, Enum):
 
 
 class LLMMessage(BaseModel):
-    """A message in the conversation."""
+    """
+    A message in the conversation.
 
-    role: MessageRole | Literal["system", "user", "assistant"]
+    Immutable; the role is stored as a plain string (a MessageRole is
+    accepted and canonicalized once at construction). Trusted callers on
+    hot paths can skip validation with LLMMessage.model_construct().
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    role: Literal["system", "user", "assistant"]
     content: str
 
+    @field_validator("role", mode="before")
+    @classmethod
+    def _role_value(cls, role: Any) -> Any:
+        return role.value if isinstance(role, MessageRole) else role
+
     def to_dict(self) -> dict[str, str]:
         """Convert to dict for API calls."""
-        role_str = self.role.value if isinstance(self.role, MessageRole) else self.role
-        return {"role": role_str, "content": self.content}
+        return {"role": self.role, "content": self.content}
 
 
 class LLMUsage(BaseModel):
@@ -87,6 +109,11 @@ class LLMProvider(ABC):
         """Model identifier."""
         ...
 
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum in-flight requests for batch_complete()."""
+        return settings.llm.max_concurrency
+
     @abstractmethod
     async def complete(
         self,
@@ -109,6 +136,98 @@ class LLMProvider(ABC):
         """
         ...
 
+    async def complete_stream(
+        self,
+        messages: list[LLMMessage],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion as text chunks.
+
+        Providers with native streaming override this; the default yields
+        the full completion as a single chunk.
+
+        Args:
+            messages: Conversation messages
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            stop_sequences: Stop generation at these sequences
+
+        Yields:
+            Generated text chunks
+        """
+        response = await self.complete(messages, temperature, max_tokens, stop_sequences)
+        yield response.content
+
+    async def batch_complete(
+        self,
+        messages_batch: list[list[LLMMessage]],
+        **kwargs: Any,
+    ) -> list[LLMResponse]:
+        """
+        Generate completions for many conversations concurrently.
+
+        Keeps a window of at most max_concurrency requests in flight,
+        starting the next request as each one finishes.
+
+        Args:
+            messages_batch: One message list per completion
+            **kwargs: Additional arguments for complete()
+
+        Returns:
+            Responses in the same order as messages_batch
+
+        Raises:
+            Exception: The first failure; requests still running are cancelled
+        """
+        results: list[LLMResponse | None] = [None] * len(messages_batch)
+        pending: dict[asyncio.Task[LLMResponse], int] = {}
+        queue = iter(enumerate(messages_batch))
+
+        def fill() -> None:
+            for index, messages in queue:
+                pending[asyncio.create_task(self.complete(messages, **kwargs))] = index
+                if len(pending) >= self.max_concurrency:
+                    break
+
+        fill()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Retrieve every finished task before raising, so no other
+                # failure is logged as never retrieved
+                errors = [e for task in done if (e := task.exception()) is not None]
+                if errors:
+                    raise errors[0]
+                for task in done:
+                    results[pending.pop(task)] = task.result()
+                fill()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return results  # type: ignore[return-value]
+
+    async def warm_up(self) -> None:
+        """
+        Prepare connections ahead of the first request.
+
+        Providers override this with a cheap, unbilled call; the default
+        does nothing.
+        """
+        return
+
+    async def close(self) -> None:
+        """
+        Release the provider's connections and background tasks.
+
+        The default does nothing.
+        """
+        return
+
     @abstractmethod
     async def health_check(self) -> dict[str, Any]:
         """
@@ -161,26 +280,18 @@ class LLMProvider(ABC):
         Returns:
             Parsed JSON dict
         """
-        import json
-
         # Add JSON instruction to system prompt
-        json_system = (system_prompt or "") + (
-            "\n\nRespond ONLY with valid JSON. No markdown, no explanation."
+        json_system = (
+            system_prompt.strip() + _JSON_INSTRUCTION_SUFFIX
+            if system_prompt and system_prompt.strip()
+            else _JSON_INSTRUCTION
         )
 
-        text = await self.generate_text(prompt, system_prompt=json_system.strip(), **kwargs)
+        text = await self.generate_text(prompt, system_prompt=json_system, **kwargs)
 
         # Clean potential markdown formatting
-        text = text.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        if text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        text = text.strip()
-
-        return json.loads(text)
+        match = _MARKDOWN_FENCE_RE.match(text.strip())
+        return orjson.loads(match.group(1).strip())
 
 
 # Global provider instance
@@ -226,6 +337,24 @@ def get_llm_provider() -> LLMProvider:
     return _provider
 
 
+async def warm_up_llm_provider() -> None:
+    """
+    Create the configured provider and warm its connections at startup.
+
+    Moves client construction and the first TCP/TLS handshake off the
+    request path. Intended for application lifespans.
+    """
+    await get_llm_provider().warm_up()
+
+
+async def close_llm_provider() -> None:
+    """Close the provider, if one was created (application shutdown)."""
+    global _provider
+    provider, _provider = _provider, None
+    if provider is not None:
+        await provider.close()
+
+
 def set_llm_provider(provider: LLMProvider) -> None:
     """
     Set a custom LLM provider.
@@ -11,10 +11,15 @@ Configures structlog for structured logging with:
 Version: 0.1.0
 """
 
+import functools
 import logging
+import re
 import sys
+import time
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
 from structlog.types import Processor
 
@@ -34,47 +39,69 @@ def _add_service_context(
     return event_dict
 
 
+# (epoch second, formatted date/time prefix) of the last timestamp;
+# replaced as one tuple so concurrent threads never see a torn pair
+_timestamp_second: tuple[int, str] = (0, "")
+
+
 def _add_timestamp(
     logger: logging.Logger,
     method_name: str,
     event_dict: dict[str, Any],
 ) -> dict[str, Any]:
     """Add ISO timestamp to log entries."""
-    import datetime
+    global _timestamp_second
+
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_second
+    if seconds != cached_seconds:
+        prefix = datetime.fromtimestamp(seconds, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_second = (seconds, prefix)
 
-    event_dict["timestamp"] = datetime.datetime.now(datetime.UTC).isoformat()
+    event_dict["timestamp"] = f"{prefix}.{nanoseconds // 1000:06d}+00:00"
     return event_dict
 
 
+_SENSITIVE_KEYS = (
+    "password",
+    "api_key",
+    "secret",
+    "token",
+    "authorization",
+    "private_key",
+    "credit_card",
+)
+
+# One pass over each key instead of a substring scan per sensitive word
+_SENSITIVE_KEY_RE = re.compile("|".join(map(re.escape, _SENSITIVE_KEYS)))
+
+
+def _censor_value(value: Any) -> Any:
+    """Censor sensitive keys inside nested dicts and lists."""
+    if isinstance(value, dict):
+        return {
+            key: (
+                "***REDACTED***" if _SENSITIVE_KEY_RE.search(key.lower()) else _censor_value(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_censor_value(item) for item in value]
+    return value
+
+
 def _censor_secrets(
     logger: logging.Logger,
     method_name: str,
     event_dict: dict[str, Any],
 ) -> dict[str, Any]:
     """Censor sensitive data in logs."""
-    sensitive_keys = {
-        "password",
-        "api_key",
-        "secret",
-        "token",
-        "authorization",
-        "private_key",
-        "credit_card",
-    }
-
-    def censor_dict(d: dict[str, Any]) -> dict[str, Any]:
-        result = {}
-        for key, value in d.items():
-            key_lower = key.lower()
-            if any(s in key_lower for s in sensitive_keys):
-                result[key] = "***REDACTED***"
-            elif isinstance(value, dict):
-                result[key] = censor_dict(value)
-            else:
-                result[key] = value
-        return result
-
-    return censor_dict(event_dict)
+    return _censor_value(event_dict)
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for JSONRenderer."""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode()
 
 
 def setup_logging(
@@ -91,10 +118,12 @@ def setup_logging(
         service_name: Name of the service for context
     """
     # Configure standard library logging
+    level = getattr(logging, log_level.upper())
+
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=level,
     )
 
     # Disable noisy loggers
@@ -117,7 +146,7 @@ def setup_logging(
     if json_logs:
         # Production: JSON output
         shared_processors.append(structlog.processors.format_exc_info)
-        renderer: Processor = structlog.processors.JSONRenderer()
+        renderer: Processor = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     else:
         # Development: Colored console output
         shared_processors.append(structlog.dev.set_exc_info)
@@ -129,13 +158,16 @@ def setup_logging(
             ),
         )
 
+    # Proxies cache the configured logger on first use; structlog's default
+    # configuration does not cache, so loggers used earlier are not pinned
     structlog.configure(
         processors=[
             *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below log_level return before any event dict is built
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
@@ -157,10 +189,16 @@ def setup_logging(
     root_logger.addHandler(root_handler)
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str | None = None) -> "BoundLogger":
     """
     Get a structured logger instance.
 
+    Loggers are lazy proxies memoized per name. A proxy resolves its
+    processor chain on first use after setup_logging() and caches it from
+    then on, so module-level loggers may be created at import time, before
+    logging is configured; they must not log until setup_logging() runs.
+
     Args:
         name: Logger name (typically __name__)
 
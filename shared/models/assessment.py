@@ -10,7 +10,9 @@ Version: 0.1.0
 from datetime import UTC, datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from shared.models.common import utcnow
 
 
 class AssessmentStatus(str, Enum):
@@ -24,6 +26,10 @@ class AssessmentStatus(str, Enum):
     EXPIRED = "expired"
 
 
+# Terminal review outcomes
+_COMPLETE_STATUSES = frozenset({AssessmentStatus.APPROVED, AssessmentStatus.REJECTED})
+
+
 class CriterionScore(BaseModel):
     """Score for a single assessment criterion."""
 
@@ -35,7 +41,7 @@ class CriterionScore(BaseModel):
     )
     notes: str | None = None
     assessor_id: str | None = None
-    assessed_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    assessed_at: datetime = Field(default_factory=utcnow)
 
 
 class AssessmentBase(BaseModel):
@@ -68,6 +74,8 @@ class AssessmentUpdate(BaseModel):
 class Assessment(AssessmentBase):
     """Full assessment model."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str = Field(..., description="Unique assessment ID")
     status: AssessmentStatus = AssessmentStatus.DRAFT
 
@@ -91,14 +99,14 @@ class Assessment(AssessmentBase):
     reviewer_id: str | None = None
 
     # Timestamps
-    started_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime = Field(default_factory=utcnow)
     submitted_at: datetime | None = None
     reviewed_at: datetime | None = None
     completed_at: datetime | None = None
     expires_at: datetime | None = None
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     # Blockchain reference
     audit_tx_hash: str | None = Field(
@@ -109,7 +117,7 @@ class Assessment(AssessmentBase):
     @property
     def is_complete(self) -> bool:
         """Check if assessment is complete."""
-        return self.status in (AssessmentStatus.APPROVED, AssessmentStatus.REJECTED)
+        return self.status in _COMPLETE_STATUSES
 
     @property
     def is_expired(self) -> bool:
@@ -118,13 +126,12 @@ class Assessment(AssessmentBase):
             return False
         return datetime.now(UTC) > self.expires_at
 
-    class Config:
-        from_attributes = True
-
 
 class AssessmentSummary(BaseModel):
     """Lightweight assessment summary."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: str
     entity_id: str
     assessment_type: str
@@ -132,7 +139,3 @@ class AssessmentSummary(BaseModel):
     overall_score: float | None
     started_at: datetime
     completed_at: datetime | None
-
-    class Config:
-        from_attributes = True
-
@@ -10,23 +10,33 @@ Version: 0.1.0
 from datetime import UTC, datetime
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
 
 T = TypeVar("T")
 
 
+def utcnow() -> datetime:
+    """Current time in UTC; shared default factory for timestamp fields."""
+    return datetime.now(UTC)
+
+
 class BaseResponse(BaseModel, Generic[T]):
     """Standard API response wrapper."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool = True
     data: T | None = None
     message: str | None = None
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utcnow)
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated API response."""
 
+    model_config = ConfigDict(frozen=True)
+
     items: list[T]
     total: int
     page: int = 1
@@ -47,20 +57,24 @@ class PaginatedResponse(BaseModel, Generic[T]):
 class ErrorResponse(BaseModel):
     """Error response model."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool = False
     error: str
     error_code: str | None = None
     details: dict[str, Any] | None = None
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utcnow)
 
 
 class HealthResponse(BaseModel):
     """Service health check response."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = "healthy"
     service: str
     version: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utcnow)
 
     # Component health
     components: dict[str, dict[str, Any]] = Field(default_factory=dict)
@@ -7,11 +7,13 @@ Models for compliance states, events, and scores.
 Version: 0.1.0
 """
 
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
+
+from shared.models.common import utcnow
 
 
 class ComplianceStatus(str, Enum):
@@ -42,9 +44,7 @@ class ComplianceState(BaseModel):
     status: ComplianceStatus
 
     # Verification
-    verification_timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(UTC)
-    )
+    verification_timestamp: datetime = Field(default_factory=utcnow)
     evidence_hash: str | None = Field(
         default=None,
         description="SHA-256 hash of evidence",
@@ -56,7 +56,8 @@ class ComplianceState(BaseModel):
 
     # Metadata
     notes: str | None = None
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    # Produced by our own services; SkipValidation avoids copying the dict
+    metadata: SkipValidation[dict[str, Any]] = Field(default_factory=dict)
 
 
 class ComplianceEvent(BaseModel):
@@ -72,13 +73,13 @@ class ComplianceEvent(BaseModel):
         ...,
         description="Event type (score_change, tier_upgrade, violation, etc.)",
     )
-    event_data: dict[str, Any] = Field(default_factory=dict)
+    event_data: SkipValidation[dict[str, Any]] = Field(default_factory=dict)
 
     # Severity
     severity: EventSeverity = EventSeverity.INFO
 
     # Timestamp
-    occurred_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    occurred_at: datetime = Field(default_factory=utcnow)
 
     # Processing
     processed: bool = False
@@ -96,7 +97,7 @@ class ComplianceGap(BaseModel):
 
     # Gap details
     current_status: ComplianceStatus = ComplianceStatus.NOT_ASSESSED
-    priority: str = Field(default="medium", description="low, medium, high, critical")
+    priority: Literal["low", "medium", "high", "critical"] = "medium"
     estimated_effort: str | None = Field(
         default=None,
         description="Estimated effort to close gap",
@@ -138,7 +139,7 @@ class ComplianceScore(BaseModel):
     not_assessed_count: int = 0
 
     # Timestamp
-    calculated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    calculated_at: datetime = Field(default_factory=utcnow)
 
     @property
     def compliance_rate(self) -> float:
@@ -154,6 +155,8 @@ class ComplianceScore(BaseModel):
 class ComplianceSummary(BaseModel):
     """High-level compliance summary for an entity."""
 
+    model_config = ConfigDict(frozen=True)
+
     entity_id: str
     entity_name: str
 
@@ -173,9 +176,6 @@ class ComplianceSummary(BaseModel):
     assessments_in_progress: int = 0
 
     # Trends
-    score_trend: str = Field(
-        default="stable",
-        description="improving, stable, declining",
-    )
+    score_trend: Literal["improving", "stable", "declining"] = "stable"
     score_change_30d: float | None = None
 
@@ -7,11 +7,13 @@ Models for entities (organizations, individuals) in the compliance system.
 Version: 0.1.0
 """
 
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from shared.models.common import utcnow
 
 
 class EntityType(str, Enum):
@@ -55,7 +57,11 @@ class EntityCreate(EntityBase):
     @classmethod
     def validate_jurisdictions(cls, v: list[str]) -> list[str]:
         """Ensure jurisdictions are uppercase ISO codes."""
-        return [j.upper() for j in v]
+        for j in v:
+            if not j.isupper():
+                return [j.upper() for j in v]
+        # Already uppercase (the usual case): keep the validated list as-is
+        return v
 
 
 class EntityUpdate(BaseModel):
@@ -73,6 +79,8 @@ class EntityUpdate(BaseModel):
 class Entity(EntityBase):
     """Full entity model with computed fields."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str = Field(..., description="Unique entity ID")
 
     # Compliance status
@@ -91,27 +99,22 @@ class Entity(EntityBase):
     )
 
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     last_assessment_at: datetime | None = None
 
     # DID (if registered on blockchain)
     did: str | None = Field(default=None, description="Decentralized Identifier")
 
-    class Config:
-        from_attributes = True
-
 
 class EntitySummary(BaseModel):
     """Lightweight entity summary for lists."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: str
     name: str
     entity_type: EntityType
     compliance_tier: ComplianceTier
     compliance_score: float | None
     jurisdictions: list[str]
-
-    class Config:
-        from_attributes = True
-
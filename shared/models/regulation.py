@@ -7,11 +7,13 @@ Models for regulations and requirements.
 Version: 0.1.0
 """
 
-from datetime import UTC, datetime, date
+from datetime import datetime, date
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
+
+from shared.models.common import utcnow
 
 
 class RequirementTier(str, Enum):
@@ -83,8 +85,8 @@ class Requirement(BaseModel):
 
     # Metadata
     parsing_metadata: dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 
 class Regulation(BaseModel):
@@ -131,8 +133,8 @@ class Regulation(BaseModel):
     parsing_metadata: dict[str, Any] = Field(default_factory=dict)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 
 class RegulatoryChange(BaseModel):
@@ -143,13 +145,13 @@ class RegulatoryChange(BaseModel):
     requirement_id: str | None = None
     change_type: ChangeType
 
-    # Change details
-    previous_version: dict[str, Any] | None = None
-    new_version: dict[str, Any] | None = None
-    diff: dict[str, Any] = Field(default_factory=dict)
+    # Change details (whole document versions, built by change detection)
+    previous_version: SkipValidation[dict[str, Any] | None] = None
+    new_version: SkipValidation[dict[str, Any] | None] = None
+    diff: SkipValidation[dict[str, Any]] = Field(default_factory=dict)
 
     # Dates
-    detected_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    detected_at: datetime = Field(default_factory=utcnow)
     effective_at: datetime | None = None
 
     # Notification
@@ -159,6 +161,8 @@ class RegulatoryChange(BaseModel):
 class RegulationSummary(BaseModel):
     """Lightweight regulation summary for lists."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     short_name: str | None
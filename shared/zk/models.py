@@ -7,10 +7,29 @@ Pydantic models for ZK proof data.
 Version: 1.0.0
 """
 
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import Enum
+from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator
+
+from shared.models.common import utcnow
+
+
+# Compliance score in basis points, as fed to the circuits
+Score = Annotated[int, Field(ge=0, le=10000)]
+
+# Compliance tier, 1 (highest) to 5
+Tier = Annotated[int, Field(ge=1, le=5)]
+
+# Score bounds (inclusive) per compliance tier, indexed by tier - 1
+_TIER_BOUNDS: tuple[tuple[int, int], ...] = (
+    (9500, 10000),
+    (8500, 9499),
+    (7000, 8499),
+    (5000, 6999),
+    (0, 4999),
+)
 
 
 class ProofType(str, Enum):
@@ -39,30 +58,28 @@ class ZKProof(BaseModel):
 
     def to_calldata(self) -> list[int]:
         """Convert to Solidity calldata format (8 uint256)."""
+        a, b, c = self.pi_a, self.pi_b, self.pi_c
+        b0, b1 = b[0], b[1]
         return [
-            int(self.pi_a[0]),
-            int(self.pi_a[1]),
-            int(self.pi_b[0][0]),
-            int(self.pi_b[0][1]),
-            int(self.pi_b[1][0]),
-            int(self.pi_b[1][1]),
-            int(self.pi_c[0]),
-            int(self.pi_c[1]),
+            int(a[0]),
+            int(a[1]),
+            int(b0[0]),
+            int(b0[1]),
+            int(b1[0]),
+            int(b1[1]),
+            int(c[0]),
+            int(c[1]),
         ]
 
     def to_hex(self) -> str:
         """Convert to hex string for storage."""
-        import json
-
-        return json.dumps(self.model_dump()).encode().hex()
+        # Serialized straight to JSON bytes by pydantic-core, no intermediate dict
+        return self.model_dump_json().encode().hex()
 
     @classmethod
     def from_hex(cls, hex_str: str) -> "ZKProof":
         """Create from hex string."""
-        import json
-
-        data = json.loads(bytes.fromhex(hex_str).decode())
-        return cls(**data)
+        return cls.model_validate_json(bytes.fromhex(hex_str))
 
 
 class PublicSignals(BaseModel):
@@ -85,7 +102,7 @@ class ProofMetadata(BaseModel):
 
     proof_type: ProofType
     circuit_name: str
-    generated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    generated_at: datetime = Field(default_factory=utcnow)
     proving_time_ms: int = Field(..., ge=0)
 
     # Entity info
@@ -120,7 +137,7 @@ class VerificationResult(BaseModel):
 
     valid: bool
     commitment: str | None = None
-    verified_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    verified_at: datetime = Field(default_factory=utcnow)
     verification_time_ms: int = Field(..., ge=0)
 
     # On-chain verification
@@ -135,63 +152,48 @@ class ThresholdProofRequest(BaseModel):
     """Request to generate a threshold proof."""
 
     entity_id: str = Field(..., description="Entity identifier (e.g., LEI)")
-    score: int = Field(..., ge=0, le=10000, description="Compliance score (0-10000)")
-    threshold: int = Field(..., ge=0, le=10000, description="Minimum threshold")
+    score: Score = Field(..., description="Compliance score (0-10000)")
+    threshold: Score = Field(..., description="Minimum threshold")
 
-    @field_validator("score")
-    @classmethod
-    def score_must_meet_threshold(cls, v: int, info) -> int:
-        threshold = info.data.get("threshold", 0)
-        if v < threshold:
-            raise ValueError(f"Score {v} does not meet threshold {threshold}")
-        return v
+    @model_validator(mode="after")
+    def score_must_meet_threshold(self) -> "ThresholdProofRequest":
+        if self.score < self.threshold:
+            raise ValueError(f"Score {self.score} does not meet threshold {self.threshold}")
+        return self
 
 
 class RangeProofRequest(BaseModel):
     """Request to generate a range proof."""
 
     entity_id: str
-    score: int = Field(..., ge=0, le=10000)
-    min_score: int = Field(..., ge=0, le=10000)
-    max_score: int = Field(..., ge=0, le=10000)
-
-    @field_validator("max_score")
-    @classmethod
-    def max_must_be_gte_min(cls, v: int, info) -> int:
-        min_score = info.data.get("min_score", 0)
-        if v < min_score:
-            raise ValueError(f"max_score {v} must be >= min_score {min_score}")
-        return v
+    score: Score
+    min_score: Score
+    max_score: Score
 
-    @field_validator("score")
-    @classmethod
-    def score_must_be_in_range(cls, v: int, info) -> int:
-        min_score = info.data.get("min_score", 0)
-        max_score = info.data.get("max_score", 10000)
-        if v < min_score or v > max_score:
-            raise ValueError(f"Score {v} not in range [{min_score}, {max_score}]")
-        return v
+    @model_validator(mode="after")
+    def score_must_be_in_range(self) -> "RangeProofRequest":
+        if self.max_score < self.min_score:
+            raise ValueError(f"max_score {self.max_score} must be >= min_score {self.min_score}")
+        if self.score < self.min_score or self.score > self.max_score:
+            raise ValueError(
+                f"Score {self.score} not in range [{self.min_score}, {self.max_score}]"
+            )
+        return self
 
 
 class TierProofRequest(BaseModel):
     """Request to generate a tier membership proof."""
 
     entity_id: str
-    score: int = Field(..., ge=0, le=10000)
-    tier: int = Field(..., ge=1, le=5, description="Target tier (1-5)")
-
-    @field_validator("score")
-    @classmethod
-    def score_must_match_tier(cls, v: int, info) -> int:
-        tier = info.data.get("tier", 1)
-        bounds = {
-            1: (9500, 10000),
-            2: (8500, 9499),
-            3: (7000, 8499),
-            4: (5000, 6999),
-            5: (0, 4999),
-        }
-        min_score, max_score = bounds.get(tier, (0, 10000))
-        if v < min_score or v > max_score:
-            raise ValueError(f"Score {v} not in tier {tier} range [{min_score}, {max_score}]")
-        return v
+    score: Score
+    tier: Tier = Field(..., description="Target tier (1-5)")
+
+    @model_validator(mode="after")
+    def score_must_match_tier(self) -> "TierProofRequest":
+        # Runs after field validation, so tier is known to be 1-5
+        min_score, max_score = _TIER_BOUNDS[self.tier - 1]
+        if self.score < min_score or self.score > max_score:
+            raise ValueError(
+                f"Score {self.score} not in tier {self.tier} range [{min_score}, {max_score}]"
+            )
+        return self
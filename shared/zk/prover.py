@@ -4,30 +4,44 @@ ZK-SNARK Proof Generation
 
 Python wrapper for generating ZK-SNARK compliance proofs.
 
-Uses snarkjs via subprocess for proof generation (primary method)
-or the Rust library via PyO3 for performance (when available).
+Uses snarkjs for proof generation: single proofs go to a long-lived
+Node worker (see shared.zk.worker), batches run the snarkjs CLI. When a
+native rapidsnark prover is configured (ZK_RAPIDSNARK_PATH), snarkjs
+only computes the witness and rapidsnark computes the Groth16 proof,
+which is much faster than snarkjs' JavaScript prover.
 
 Version: 1.0.0
 """
 
 import asyncio
+import contextlib
 import hashlib
-import json
+import os
 import secrets
-import subprocess
+import tempfile
 import time
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from shared.config import settings
 from shared.logging import get_logger
 from shared.zk.models import (
+    _TIER_BOUNDS,
     ProofMetadata,
     ProofType,
     ProofWithMetadata,
     PublicSignals,
+    RangeProofRequest,
+    ThresholdProofRequest,
+    TierProofRequest,
     ZKProof,
 )
+from shared.zk.worker import get_snarkjs_worker
 
 
 logger = get_logger(__name__)
@@ -35,8 +49,15 @@ logger = get_logger(__name__)
 # Default circuit build directory
 DEFAULT_BUILD_DIR = Path(__file__).parent.parent.parent / "circuits" / "build"
 
+# Bounds of the cache of proofs for caller-salted jobs
+_PROOF_CACHE_ENTRIES = 10_000
+_PROOF_CACHE_TTL_SECONDS = 3600
+
+# BN254 scalar field order
+_BN254_FR = 21888242871839275222246405745257275088548364400416034343698204186575808495617
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThresholdInput:
     """Input for threshold proof."""
 
@@ -46,7 +67,7 @@ class ThresholdInput:
     salt: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RangeInput:
     """Input for range proof."""
 
@@ -57,7 +78,7 @@ class RangeInput:
     salt: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TierInput:
     """Input for tier proof."""
 
@@ -81,15 +102,22 @@ class ComplianceProver:
         )
     """
 
-    def __init__(self, build_dir: str | Path | None = None):
+    def __init__(
+        self,
+        build_dir: str | Path | None = None,
+        rapidsnark_path: str | None = None,
+    ):
         """
         Initialize the prover.
 
         Args:
             build_dir: Path to circuit build directory.
                       Defaults to circuits/build/
+            rapidsnark_path: Native rapidsnark prover binary.
+                      Defaults to settings.zk.rapidsnark_path; snarkjs when unset
         """
         self.build_dir = Path(build_dir) if build_dir else DEFAULT_BUILD_DIR
+        self.rapidsnark_path = rapidsnark_path or settings.zk.rapidsnark_path
         self._validate_setup()
 
     def _validate_setup(self) -> None:
@@ -106,35 +134,51 @@ class ComplianceProver:
 
         Uses SHA-256 and reduces mod field order.
         """
-        # SHA-256 hash
         digest = hashlib.sha256(entity_id.encode()).digest()
-
-        # Convert to integer
-        hash_int = int.from_bytes(digest, "big")
-
-        # BN254 scalar field order
-        field_order = 21888242871839275222246405745257275088548364400416034343698204186575808495617
-
-        # Reduce mod field order
-        return str(hash_int % field_order)
+        return str(int.from_bytes(digest, "big") % _BN254_FR)
 
     def _generate_salt(self) -> str:
         """Generate a random salt as a field element."""
-        # Generate 31 bytes (< 32 to stay under field order)
-        salt_bytes = secrets.token_bytes(31)
-        return str(int.from_bytes(salt_bytes, "big"))
+        # 248 bits stays under the 254-bit field order
+        return str(secrets.randbits(248))
 
-    async def _run_snarkjs(
+    async def _run_command(
         self,
+        command: list[str],
         circuit_name: str,
-        input_data: dict[str, Any],
-    ) -> tuple[dict, list[str], int]:
+    ) -> None:
         """
-        Run snarkjs to generate a proof.
+        Run a prover command, raising RuntimeError if it fails.
 
-        Returns:
-            Tuple of (proof_json, public_signals, proving_time_ms)
+        Outputs are exchanged as files, so stdout (progress logging) is
+        discarded rather than buffered; only stderr is kept for errors.
         """
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.build_dir.parent,
+        )
+        try:
+            _, stderr_bytes = await process.communicate()
+        except asyncio.CancelledError:
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+            raise
+
+        if process.returncode != 0:
+            stderr = stderr_bytes.decode(errors="replace")
+            logger.error(
+                "snarkjs_proof_generation_failed",
+                stderr=stderr,
+                circuit=circuit_name,
+                command=command[0],
+            )
+            raise RuntimeError(f"Proof generation failed: {stderr}")
+
+    def _circuit_files(self, circuit_name: str) -> tuple[Path, Path]:
+        """Return the (wasm, zkey) paths for a circuit, checking they exist."""
         circuit_dir = self.build_dir / circuit_name
         wasm_path = circuit_dir / f"{circuit_name}_js" / f"{circuit_name}.wasm"
         zkey_path = circuit_dir / "proving_key.zkey"
@@ -144,63 +188,163 @@ class ComplianceProver:
         if not zkey_path.exists():
             raise FileNotFoundError(f"Proving key not found: {zkey_path}")
 
-        # Write input to temp file
-        input_file = circuit_dir / "input_temp.json"
-        with open(input_file, "w") as f:
-            json.dump(input_data, f)
+        return wasm_path, zkey_path
+
+    async def _solve(self, circuit_name: str, input_file: Path, witness_file: Path) -> None:
+        """Compute the circuit witness for an input (memory-bound stage)."""
+        wasm_path, _ = self._circuit_files(circuit_name)
+        await self._run_command(
+            [
+                "npx",
+                "snarkjs",
+                "wtns",
+                "calculate",
+                str(wasm_path),
+                str(input_file),
+                str(witness_file),
+            ],
+            circuit_name,
+        )
 
-        try:
-            start_time = time.time()
+    async def _prove_from_witness(
+        self,
+        circuit_name: str,
+        witness_file: Path,
+        proof_file: Path,
+        public_file: Path,
+    ) -> None:
+        """Compute the Groth16 proof from a witness (compute-bound stage)."""
+        _, zkey_path = self._circuit_files(circuit_name)
+        if self.rapidsnark_path:
+            command = [self.rapidsnark_path]
+        else:
+            command = ["npx", "snarkjs", "groth16", "prove"]
+
+        await self._run_command(
+            [*command, str(zkey_path), str(witness_file), str(proof_file), str(public_file)],
+            circuit_name,
+        )
 
-            # Run snarkjs
-            result = await asyncio.to_thread(
-                subprocess.run,
-                [
-                    "npx",
-                    "snarkjs",
-                    "groth16",
-                    "fullprove",
-                    str(input_file),
-                    str(wasm_path),
-                    str(zkey_path),
-                    str(circuit_dir / "proof_temp.json"),
-                    str(circuit_dir / "public_temp.json"),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=self.build_dir.parent,
-            )
+    async def _run_snarkjs(
+        self,
+        circuit_name: str,
+        input_data: dict[str, Any],
+        solve_slots: asyncio.Semaphore | None = None,
+        prove_slots: asyncio.Semaphore | None = None,
+    ) -> tuple[dict, list[str], int]:
+        """
+        Run snarkjs (and rapidsnark, if configured) to generate a proof.
 
-            proving_time_ms = int((time.time() - start_time) * 1000)
+        Args:
+            circuit_name: Circuit to prove
+            input_data: Circuit input signals
+            solve_slots: Bound on concurrent witness computations (batch use)
+            prove_slots: Bound on concurrent proof computations (batch use)
 
-            if result.returncode != 0:
+        Returns:
+            Tuple of (proof_json, public_signals, proving_time_ms)
+        """
+        wasm_path, zkey_path = self._circuit_files(circuit_name)
+
+        if solve_slots is None and prove_slots is None and not self.rapidsnark_path:
+            # A lone snarkjs proof goes to the long-lived worker, exchanging
+            # input and output over pipes instead of temp files
+            start_ns = time.monotonic_ns()
+            try:
+                output = await get_snarkjs_worker(self.build_dir.parent).request(
+                    "prove",
+                    wasm=str(wasm_path),
+                    zkey=str(zkey_path),
+                    input=input_data,
+                )
+            except RuntimeError as e:
                 logger.error(
                     "snarkjs_proof_generation_failed",
-                    stderr=result.stderr,
+                    stderr=str(e),
                     circuit=circuit_name,
+                    command="node",
                 )
-                raise RuntimeError(f"Proof generation failed: {result.stderr}")
+                raise RuntimeError(f"Proof generation failed: {e}") from e
+            proving_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+
+            proof_json, public_signals = output["proof"], output["publicSignals"]
+        else:
+            # The staged CLIs exchange witness and proof as files; use a
+            # per-call directory so concurrent proofs never share them
+            with tempfile.TemporaryDirectory(prefix=f"{circuit_name}_") as work_dir:
+                input_file = Path(work_dir) / "input.json"
+                witness_file = Path(work_dir) / "witness.wtns"
+                proof_file = Path(work_dir) / "proof.json"
+                public_file = Path(work_dir) / "public.json"
+
+                input_file.write_bytes(orjson.dumps(input_data))
+
+                # Time the stages only, not the wait for a free slot
+                async with solve_slots or contextlib.nullcontext():
+                    start_ns = time.monotonic_ns()
+                    await self._solve(circuit_name, input_file, witness_file)
+                    elapsed_ns = time.monotonic_ns() - start_ns
+                async with prove_slots or contextlib.nullcontext():
+                    start_ns = time.monotonic_ns()
+                    await self._prove_from_witness(
+                        circuit_name, witness_file, proof_file, public_file
+                    )
+                    elapsed_ns += time.monotonic_ns() - start_ns
+                proving_time_ms = elapsed_ns // 1_000_000
+
+                proof_json = orjson.loads(proof_file.read_bytes())
+                public_signals = orjson.loads(public_file.read_bytes())
+
+        logger.info(
+            "zk_proof_generated",
+            circuit=circuit_name,
+            proving_time_ms=proving_time_ms,
+            backend="rapidsnark" if self.rapidsnark_path else "snarkjs",
+        )
 
-            # Read outputs
-            with open(circuit_dir / "proof_temp.json") as f:
-                proof_json = json.load(f)
-            with open(circuit_dir / "public_temp.json") as f:
-                public_signals = json.load(f)
+        return proof_json, public_signals, proving_time_ms
 
-            logger.info(
-                "zk_proof_generated",
-                circuit=circuit_name,
-                proving_time_ms=proving_time_ms,
-            )
+    async def prove_many(
+        self,
+        jobs: list[tuple[str, dict[str, Any]]],
+        max_concurrency: int | None = None,
+    ) -> list[tuple[dict, list[str], int]]:
+        """
+        Generate many proofs, pipelining witness and proof computation.
+
+        Witness computation (snarkjs) and proof computation (rapidsnark or
+        snarkjs) run as separate stages with their own concurrency bounds,
+        so one job's witness is solved while another job is being proved.
 
-            return proof_json, public_signals, proving_time_ms
+        Args:
+            jobs: (circuit_name, input_data) pairs
+            max_concurrency: Jobs allowed in each stage at once
+                (default: CPU count)
+
+        Returns:
+            (proof_json, public_signals, proving_time_ms) per job, in job order
+
+        Raises:
+            RuntimeError: If any job fails; the remaining jobs are cancelled
+        """
+        limit = max_concurrency or os.cpu_count() or 1
+        solve_slots = asyncio.Semaphore(limit)
+        prove_slots = asyncio.Semaphore(limit)
 
+        tasks = [
+            asyncio.ensure_future(
+                self._run_snarkjs(circuit_name, input_data, solve_slots, prove_slots)
+            )
+            for circuit_name, input_data in jobs
+        ]
+        try:
+            return await asyncio.gather(*tasks)
         finally:
-            # Cleanup temp files
-            for temp_file in ["input_temp.json", "proof_temp.json", "public_temp.json"]:
-                temp_path = circuit_dir / temp_file
-                if temp_path.exists():
-                    temp_path.unlink()
+            # On failure, stop the remaining jobs rather than leaving them
+            # running (and holding slots) with no one to collect them
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def prove_threshold(
         self,
@@ -216,7 +360,8 @@ class ComplianceProver:
             score: Actual compliance score (0-10000)
             threshold: Minimum required score
             entity_id: Entity identifier (e.g., LEI)
-            salt: Optional salt (generated if not provided)
+            salt: Optional salt (generated if not provided); proofs for a given
+                salt are cached and reused for identical calls
 
         Returns:
             ProofWithMetadata containing the proof and metadata
@@ -224,36 +369,37 @@ class ComplianceProver:
         Raises:
             ValueError: If score < threshold or values out of range
         """
+        return await self._prove(self._threshold_job(score, threshold, entity_id, salt))
+
+    def _threshold_job(
+        self,
+        score: int,
+        threshold: int,
+        entity_id: str,
+        salt: str | None,
+    ) -> "_ProofJob":
+        """Validate threshold proof inputs and build the circuit job."""
         if score < threshold:
             raise ValueError(f"Score {score} does not meet threshold {threshold}")
         if score > 10000 or threshold > 10000:
             raise ValueError("Score and threshold must be <= 10000")
 
         entity_hash = self._hash_entity_id(entity_id)
+        memoizable = bool(salt)
         salt = salt or self._generate_salt()
 
-        input_data = {
-            "threshold": threshold,
-            "entityHash": entity_hash,
-            "score": score,
-            "salt": salt,
-        }
-
-        proof_json, public_signals, proving_time_ms = await self._run_snarkjs(
-            "compliance_threshold",
-            input_data,
-        )
-
-        return ProofWithMetadata(
-            proof=ZKProof(**proof_json),
-            public_signals=PublicSignals(signals=public_signals),
-            metadata=ProofMetadata(
-                proof_type=ProofType.THRESHOLD,
-                circuit_name="compliance_threshold",
-                proving_time_ms=proving_time_ms,
-                entity_hash=entity_hash,
-                threshold=threshold,
-            ),
+        return _ProofJob(
+            proof_type=ProofType.THRESHOLD,
+            circuit_name="compliance_threshold",
+            input_data={
+                "threshold": threshold,
+                "entityHash": entity_hash,
+                "score": score,
+                "salt": salt,
+            },
+            entity_hash=entity_hash,
+            metadata={"threshold": threshold},
+            memoizable=memoizable,
         )
 
     async def prove_range(
@@ -272,41 +418,42 @@ class ComplianceProver:
             min_score: Minimum of range (inclusive)
             max_score: Maximum of range (inclusive)
             entity_id: Entity identifier
-            salt: Optional salt
+            salt: Optional salt (proofs for a given salt are cached)
 
         Returns:
             ProofWithMetadata containing the proof
         """
+        return await self._prove(self._range_job(score, min_score, max_score, entity_id, salt))
+
+    def _range_job(
+        self,
+        score: int,
+        min_score: int,
+        max_score: int,
+        entity_id: str,
+        salt: str | None,
+    ) -> "_ProofJob":
+        """Validate range proof inputs and build the circuit job."""
         if score < min_score or score > max_score:
             raise ValueError(f"Score {score} not in range [{min_score}, {max_score}]")
 
         entity_hash = self._hash_entity_id(entity_id)
+        memoizable = bool(salt)
         salt = salt or self._generate_salt()
 
-        input_data = {
-            "minScore": min_score,
-            "maxScore": max_score,
-            "entityHash": entity_hash,
-            "score": score,
-            "salt": salt,
-        }
-
-        proof_json, public_signals, proving_time_ms = await self._run_snarkjs(
-            "range_proof",
-            input_data,
-        )
-
-        return ProofWithMetadata(
-            proof=ZKProof(**proof_json),
-            public_signals=PublicSignals(signals=public_signals),
-            metadata=ProofMetadata(
-                proof_type=ProofType.RANGE,
-                circuit_name="range_proof",
-                proving_time_ms=proving_time_ms,
-                entity_hash=entity_hash,
-                min_score=min_score,
-                max_score=max_score,
-            ),
+        return _ProofJob(
+            proof_type=ProofType.RANGE,
+            circuit_name="range_proof",
+            input_data={
+                "minScore": min_score,
+                "maxScore": max_score,
+                "entityHash": entity_hash,
+                "score": score,
+                "salt": salt,
+            },
+            entity_hash=entity_hash,
+            metadata={"min_score": min_score, "max_score": max_score},
+            memoizable=memoizable,
         )
 
     async def prove_tier(
@@ -323,49 +470,178 @@ class ComplianceProver:
             score: Actual compliance score
             tier: Target tier (1-5)
             entity_id: Entity identifier
-            salt: Optional salt
+            salt: Optional salt (proofs for a given salt are cached)
 
         Returns:
             ProofWithMetadata containing the proof
         """
-        tier_bounds = {
-            1: (9500, 10000),
-            2: (8500, 9499),
-            3: (7000, 8499),
-            4: (5000, 6999),
-            5: (0, 4999),
-        }
-
-        if tier not in tier_bounds:
+        return await self._prove(self._tier_job(score, tier, entity_id, salt))
+
+    def _tier_job(
+        self,
+        score: int,
+        tier: int,
+        entity_id: str,
+        salt: str | None,
+    ) -> "_ProofJob":
+        """Validate tier proof inputs and build the circuit job."""
+        if not 1 <= tier <= len(_TIER_BOUNDS):
             raise ValueError(f"Invalid tier {tier}, must be 1-5")
 
-        min_score, max_score = tier_bounds[tier]
+        min_score, max_score = _TIER_BOUNDS[tier - 1]
         if score < min_score or score > max_score:
             raise ValueError(f"Score {score} not in tier {tier} range [{min_score}, {max_score}]")
 
         entity_hash = self._hash_entity_id(entity_id)
+        memoizable = bool(salt)
         salt = salt or self._generate_salt()
 
-        input_data = {
-            "targetTier": tier,
-            "entityHash": entity_hash,
-            "score": score,
-            "salt": salt,
-        }
-
-        proof_json, public_signals, proving_time_ms = await self._run_snarkjs(
-            "tier_membership",
-            input_data,
+        return _ProofJob(
+            proof_type=ProofType.TIER,
+            circuit_name="tier_membership",
+            input_data={
+                "targetTier": tier,
+                "entityHash": entity_hash,
+                "score": score,
+                "salt": salt,
+            },
+            entity_hash=entity_hash,
+            metadata={"tier": tier},
+            memoizable=memoizable,
         )
 
-        return ProofWithMetadata(
-            proof=ZKProof(**proof_json),
-            public_signals=PublicSignals(signals=public_signals),
-            metadata=ProofMetadata(
-                proof_type=ProofType.TIER,
-                circuit_name="tier_membership",
-                proving_time_ms=proving_time_ms,
-                entity_hash=entity_hash,
-                tier=tier,
-            ),
+    async def prove_batch(
+        self,
+        requests: Sequence[ThresholdProofRequest | RangeProofRequest | TierProofRequest],
+        max_concurrency: int | None = None,
+    ) -> list[ProofWithMetadata]:
+        """
+        Generate proofs for many independent requests in parallel.
+
+        All inputs are validated before any proof starts, so an invalid
+        request fails the batch without spending proving time.
+
+        Args:
+            requests: Threshold, range and tier proof requests, in any mix
+            max_concurrency: Proofs allowed in each proving stage at once
+                (default: CPU count)
+
+        Returns:
+            ProofWithMetadata per request, in request order
+
+        Usage:
+            proofs = await prover.prove_batch(
+                [
+                    ThresholdProofRequest(entity_id="LEI-1", score=8500, threshold=8000),
+                    TierProofRequest(entity_id="LEI-2", score=9700, tier=1),
+                ]
+            )
+        """
+        jobs = [self._job_for_request(request) for request in requests]
+        outputs = await self.prove_many(
+            [(job.circuit_name, job.input_data) for job in jobs],
+            max_concurrency=max_concurrency,
         )
+        return [_to_proof(job, *output) for job, output in zip(jobs, outputs)]
+
+    def _job_for_request(
+        self,
+        request: ThresholdProofRequest | RangeProofRequest | TierProofRequest,
+    ) -> "_ProofJob":
+        """Build the circuit job for a proof request model."""
+        if isinstance(request, ThresholdProofRequest):
+            return self._threshold_job(request.score, request.threshold, request.entity_id, None)
+        if isinstance(request, RangeProofRequest):
+            return self._range_job(
+                request.score, request.min_score, request.max_score, request.entity_id, None
+            )
+        return self._tier_job(request.score, request.tier, request.entity_id, None)
+
+    async def _prove(self, job: "_ProofJob") -> ProofWithMetadata:
+        """Generate the proof for a single job, reusing a cached one if possible."""
+        if not job.memoizable:
+            return _to_proof(job, *await self._run_snarkjs(job.circuit_name, job.input_data))
+
+        key = _proof_cache_key(self.build_dir, job)
+        cached = _get_cached_proof(key)
+        if cached is not None:
+            logger.debug("zk_proof_cache_hit", circuit=job.circuit_name)
+            return cached
+
+        proof = _to_proof(job, *await self._run_snarkjs(job.circuit_name, job.input_data))
+        _set_cached_proof(key, proof)
+        return proof
+
+
+@dataclass(frozen=True, slots=True)
+class _ProofJob:
+    """A validated proof to generate: circuit input plus result metadata."""
+
+    proof_type: ProofType
+    circuit_name: str
+    input_data: dict[str, Any]
+    entity_hash: str
+    # Proof-type specific ProofMetadata fields
+    metadata: dict[str, Any]
+    # The salt came from the caller, so the same job always proves the
+    # same statement and a cached proof can stand in for a new one
+    memoizable: bool = False
+
+
+def _to_proof(
+    job: _ProofJob,
+    proof_json: dict,
+    public_signals: list[str],
+    proving_time_ms: int,
+) -> ProofWithMetadata:
+    """Assemble the prover output for a job into a ProofWithMetadata."""
+    return ProofWithMetadata(
+        proof=ZKProof(**proof_json),
+        public_signals=PublicSignals(signals=public_signals),
+        metadata=ProofMetadata(
+            proof_type=job.proof_type,
+            circuit_name=job.circuit_name,
+            proving_time_ms=proving_time_ms,
+            entity_hash=job.entity_hash,
+            **job.metadata,
+        ),
+    )
+
+
+# Proofs of caller-salted jobs, oldest first. Access happens only from the
+# event loop thread without awaiting, so no lock is needed around this
+_proof_cache: OrderedDict[bytes, tuple[float, ProofWithMetadata]] = OrderedDict()
+
+
+def _proof_cache_key(build_dir: Path, job: _ProofJob) -> bytes:
+    """Key a job by its circuit build and input signals."""
+    return hashlib.blake2b(
+        orjson.dumps(
+            [str(build_dir), job.circuit_name, job.input_data],
+            option=orjson.OPT_SORT_KEYS,
+        ),
+        digest_size=16,
+    ).digest()
+
+
+def _get_cached_proof(key: bytes) -> ProofWithMetadata | None:
+    """Return a copy of a cached proof, or None on a miss."""
+    entry = _proof_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, proof = entry
+    if expires_at < time.monotonic():
+        del _proof_cache[key]
+        return None
+
+    _proof_cache.move_to_end(key)
+    return proof.model_copy(deep=True)
+
+
+def _set_cached_proof(key: bytes, proof: ProofWithMetadata) -> None:
+    """Cache a proof, evicting the least recently used beyond the bound."""
+    _proof_cache[key] = (time.monotonic() + _PROOF_CACHE_TTL_SECONDS, proof.model_copy(deep=True))
+    _proof_cache.move_to_end(key)
+    while len(_proof_cache) > _PROOF_CACHE_ENTRIES:
+        _proof_cache.popitem(last=False)
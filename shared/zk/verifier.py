@@ -7,9 +7,6 @@ Verify ZK-SNARK compliance proofs off-chain and on-chain.
 Version: 1.0.0
 """
 
-import asyncio
-import json
-import subprocess
 import time
 from pathlib import Path
 from typing import Any
@@ -20,6 +17,7 @@ from shared.zk.models import (
     VerificationResult,
     ZKProof,
 )
+from shared.zk.worker import get_snarkjs_worker
 
 
 logger = get_logger(__name__)
@@ -70,54 +68,32 @@ class ComplianceVerifier:
                 error=f"Verification key not found: {vkey_path}",
             )
 
-        circuit_dir = self.build_dir / circuit_name
-        proof_file = circuit_dir / "verify_proof_temp.json"
-        public_file = circuit_dir / "verify_public_temp.json"
-
+        start_ns = time.monotonic_ns()
+        error = None
         try:
-            with open(proof_file, "w") as f:
-                json.dump(proof.model_dump(), f)
-            with open(public_file, "w") as f:
-                json.dump(public_signals, f)
-
-            start_time = time.time()
-
-            result = await asyncio.to_thread(
-                subprocess.run,
-                [
-                    "npx",
-                    "snarkjs",
-                    "groth16",
-                    "verify",
-                    str(vkey_path),
-                    str(public_file),
-                    str(proof_file),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=self.build_dir.parent,
+            is_valid = await get_snarkjs_worker(self.build_dir.parent).request(
+                "verify",
+                vkey=str(vkey_path),
+                publicSignals=public_signals,
+                proof=proof.model_dump(),
             )
+        except RuntimeError as e:
+            is_valid, error = False, str(e)
 
-            verification_time_ms = int((time.time() - start_time) * 1000)
-            is_valid = "OK" in result.stdout or result.returncode == 0
-
-            logger.info(
-                "zk_proof_verified",
-                circuit=circuit_name,
-                valid=is_valid,
-                verification_time_ms=verification_time_ms,
-            )
+        verification_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
-            return VerificationResult(
-                valid=is_valid,
-                verification_time_ms=verification_time_ms,
-                error=result.stderr if not is_valid else None,
-            )
+        logger.info(
+            "zk_proof_verified",
+            circuit=circuit_name,
+            valid=is_valid,
+            verification_time_ms=verification_time_ms,
+        )
 
-        finally:
-            for temp_file in [proof_file, public_file]:
-                if temp_file.exists():
-                    temp_file.unlink()
+        return VerificationResult(
+            valid=is_valid,
+            verification_time_ms=verification_time_ms,
+            error=error,
+        )
 
     async def verify_off_chain(
         self,
@@ -132,70 +108,13 @@ class ComplianceVerifier:
         Returns:
             VerificationResult with verification status
         """
-        circuit_name = proof.metadata.circuit_name
-        vkey_path = self.build_dir / circuit_name / "verification_key.json"
-
-        if not vkey_path.exists():
-            return VerificationResult(
-                valid=False,
-                verification_time_ms=0,
-                error=f"Verification key not found: {vkey_path}",
-            )
-
-        # Write proof and public signals to temp files
-        circuit_dir = self.build_dir / circuit_name
-        proof_file = circuit_dir / "verify_proof_temp.json"
-        public_file = circuit_dir / "verify_public_temp.json"
-
-        try:
-            with open(proof_file, "w") as f:
-                json.dump(proof.proof.model_dump(), f)
-            with open(public_file, "w") as f:
-                json.dump(proof.public_signals.signals, f)
-
-            start_time = time.time()
-
-            # Run snarkjs verify
-            result = await asyncio.to_thread(
-                subprocess.run,
-                [
-                    "npx",
-                    "snarkjs",
-                    "groth16",
-                    "verify",
-                    str(vkey_path),
-                    str(public_file),
-                    str(proof_file),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=self.build_dir.parent,
-            )
-
-            verification_time_ms = int((time.time() - start_time) * 1000)
-
-            # Check result
-            is_valid = "OK" in result.stdout or result.returncode == 0
-
-            logger.info(
-                "zk_proof_verified",
-                circuit=circuit_name,
-                valid=is_valid,
-                verification_time_ms=verification_time_ms,
-            )
-
-            return VerificationResult(
-                valid=is_valid,
-                commitment=proof.commitment,
-                verification_time_ms=verification_time_ms,
-                error=result.stderr if not is_valid else None,
-            )
-
-        finally:
-            # Cleanup
-            for temp_file in [proof_file, public_file]:
-                if temp_file.exists():
-                    temp_file.unlink()
+        result = await self.verify(
+            proof.proof,
+            proof.public_signals.signals,
+            proof.metadata.circuit_name,
+        )
+        result.commitment = proof.commitment
+        return result
 
     async def verify_on_chain(
         self,
@@ -0,0 +1,280 @@
+"""
+snarkjs Worker
+==============
+
+Long-lived Node.js process serving snarkjs prove and verify requests.
+
+Running snarkjs per proof pays Node start-up and snarkjs module loading
+every time. The worker loads snarkjs once and caches verification keys;
+requests and replies are JSON lines tagged with an id, so any number of
+requests can be in flight over one pipe.
+
+Workers are process-wide, one per working directory (snarkjs is resolved
+from its node_modules). close_snarkjs_workers() stops them at
+application shutdown.
+
+Version: 0.1.0
+"""
+
+import asyncio
+import itertools
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from shared.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Request: {"id", "op": "prove", "wasm", "zkey", "input"} or
+# {"id", "op": "verify", "vkey", "publicSignals", "proof"}.
+# Reply: {"id", "result"} or {"id", "error"}.
+_WORKER_SCRIPT = """
+const fs = require("fs");
+const readline = require("readline");
+
+// stdout carries replies only; send any logging (snarkjs, circom log()) to stderr
+console.log = console.info = console.debug = console.error;
+
+const snarkjs = require("snarkjs");
+
+const vkeys = new Map();
+function loadVkey(path) {
+    if (!vkeys.has(path)) vkeys.set(path, JSON.parse(fs.readFileSync(path, "utf8")));
+    return vkeys.get(path);
+}
+
+async function handle(req) {
+    switch (req.op) {
+        case "prove":
+            return await snarkjs.groth16.fullProve(req.input, req.wasm, req.zkey);
+        case "verify":
+            return await snarkjs.groth16.verify(loadVkey(req.vkey), req.publicSignals, req.proof);
+        default:
+            throw new Error(`Unknown op: ${req.op}`);
+    }
+}
+
+function reply(message) {
+    process.stdout.write(JSON.stringify(message) + "\\n");
+}
+
+// snarkjs keeps worker threads alive, so exit explicitly once stdin is
+// closed and in-flight requests have replied
+let inflight = 0;
+let closing = false;
+function exitIfIdle() {
+    if (closing && inflight === 0) process.exit(0);
+}
+
+const lines = readline.createInterface({ input: process.stdin });
+lines.on("line", async (line) => {
+    const req = JSON.parse(line);
+    inflight++;
+    try {
+        reply({ id: req.id, result: await handle(req) });
+    } catch (err) {
+        reply({ id: req.id, error: String((err && err.stack) || err) });
+    }
+    inflight--;
+    exitIfIdle();
+});
+lines.on("close", () => {
+    closing = true;
+    exitIfIdle();
+});
+"""
+
+_CLOSE_TIMEOUT_SECONDS = 30.0
+_REQUEST_TIMEOUT_SECONDS = 300.0
+# Reply lines carry whole proofs; well above asyncio's 64 KiB default
+_MAX_LINE_BYTES = 16 * 1024 * 1024
+
+
+class SnarkjsWorker:
+    """
+    Client for one long-lived snarkjs Node process.
+
+    The process is started on first request and restarted if it exits.
+    """
+
+    def __init__(self, cwd: Path, request_timeout: float = _REQUEST_TIMEOUT_SECONDS) -> None:
+        """
+        Initialize the worker client.
+
+        Args:
+            cwd: Working directory of the Node process
+            request_timeout: Seconds to wait for a reply before failing a request
+        """
+        self.cwd = cwd
+        self.request_timeout = request_timeout
+        self._process: asyncio.subprocess.Process | None = None
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._reader: asyncio.Task[None] | None = None
+        self._ids = itertools.count()
+        self._start_lock = asyncio.Lock()
+
+    async def _get_process(
+        self,
+    ) -> tuple[asyncio.subprocess.Process, dict[int, asyncio.Future[Any]]]:
+        """Return the running process and its pending requests, starting it if needed."""
+        async with self._start_lock:
+            if self._process is None or self._process.returncode is not None:
+                self._process = await asyncio.create_subprocess_exec(
+                    "node",
+                    "-e",
+                    _WORKER_SCRIPT,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    cwd=self.cwd,
+                    limit=_MAX_LINE_BYTES,
+                )
+                # Each process gets its own table, so a dying process only
+                # fails the requests that were sent to it
+                self._pending = {}
+                self._reader = asyncio.create_task(self._read_replies(self._process, self._pending))
+                logger.info("snarkjs_worker_started", pid=self._process.pid, cwd=str(self.cwd))
+
+            return self._process, self._pending
+
+    @staticmethod
+    async def _read_replies(
+        process: asyncio.subprocess.Process,
+        pending: dict[int, asyncio.Future[Any]],
+    ) -> None:
+        """
+        Resolve pending requests from the worker's replies until it exits.
+
+        If reading fails the process is killed, so that the next request
+        starts a fresh one instead of waiting on a process nobody reads.
+        Either way, requests still pending are failed.
+        """
+        assert process.stdout is not None
+        eof = False
+        try:
+            while line := await process.stdout.readline():
+                reply = _parse_reply(line)
+                if reply is None:
+                    logger.warning(
+                        "snarkjs_worker_stray_output",
+                        pid=process.pid,
+                        line=line[:200].decode(errors="replace"),
+                    )
+                    continue
+
+                future = pending.pop(reply["id"], None)
+                if future is None or future.done():
+                    # The caller was cancelled or timed out
+                    continue
+                if "error" in reply:
+                    future.set_exception(RuntimeError(reply["error"]))
+                else:
+                    future.set_result(reply.get("result"))
+            eof = True
+        except Exception as e:
+            logger.error("snarkjs_worker_read_failed", pid=process.pid, error=str(e))
+        finally:
+            if not eof and process.returncode is None:
+                process.kill()
+            returncode = await process.wait()
+            if returncode != 0:
+                logger.error("snarkjs_worker_exited", pid=process.pid, returncode=returncode)
+
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError(f"snarkjs worker exited with code {returncode}")
+                    )
+            pending.clear()
+
+    async def request(self, op: str, **params: Any) -> Any:
+        """
+        Send a request and wait for its result.
+
+        Args:
+            op: Operation ("prove" or "verify")
+            **params: Operation parameters
+
+        Returns:
+            Operation result: {proof, publicSignals} for prove, a bool for verify
+
+        Raises:
+            RuntimeError: If the operation fails, the worker exits or no
+                reply arrives within request_timeout
+        """
+        process, pending = await self._get_process()
+        assert process.stdin is not None
+
+        request_id = next(self._ids)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        pending[request_id] = future
+        try:
+            process.stdin.write(orjson.dumps({"id": request_id, "op": op, **params}) + b"\n")
+            await process.stdin.drain()
+            return await asyncio.wait_for(future, self.request_timeout)
+        except TimeoutError:
+            raise RuntimeError(
+                f"snarkjs worker did not reply to {op} within {self.request_timeout}s"
+            ) from None
+        finally:
+            pending.pop(request_id, None)
+
+    async def close(self) -> None:
+        """Stop the Node process once in-flight requests finish, killing it after a timeout."""
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+
+        assert process.stdin is not None
+        process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), _CLOSE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+
+        if self._reader is not None:
+            await self._reader
+            self._reader = None
+
+
+def _parse_reply(line: bytes) -> dict[str, Any] | None:
+    """Parse a reply line, or return None for output that is not a reply."""
+    try:
+        reply = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None
+    return reply if isinstance(reply, dict) and "id" in reply else None
+
+
+# Access happens only from the event loop thread without awaiting, so no
+# lock is needed around this
+_workers: dict[Path, SnarkjsWorker] = {}
+
+
+def get_snarkjs_worker(cwd: Path) -> SnarkjsWorker:
+    """
+    Get the shared worker for a working directory, creating it on first use.
+
+    Args:
+        cwd: Directory whose node_modules provide snarkjs
+
+    Returns:
+        SnarkjsWorker instance
+    """
+    worker = _workers.get(cwd)
+    if worker is None:
+        worker = _workers[cwd] = SnarkjsWorker(cwd)
+
+    return worker
+
+
+async def close_snarkjs_workers() -> None:
+    """Stop all shared workers (application shutdown)."""
+    workers = list(_workers.values())
+    _workers.clear()
+
+    for worker in workers:
+        await worker.close()
@@ -0,0 +1,101 @@
+"""
+Unit tests for concurrent database health checks and warm-up.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from shared.database.health import health_check_all, warm_up_all
+from shared.database.postgres import PostgresClient
+
+
+class TestHealthCheckAll:
+    """Tests for health_check_all."""
+
+    @pytest.mark.asyncio
+    async def test_runs_checks_concurrently(self) -> None:
+        """Test that checks overlap instead of running back to back."""
+        running = 0
+        peak = 0
+
+        async def check() -> dict[str, Any]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"status": "healthy"}
+
+        result = await health_check_all({"a": check, "b": check, "c": check})
+
+        assert peak == 3
+        assert result == {name: {"status": "healthy"} for name in ("a", "b", "c")}
+
+    @pytest.mark.asyncio
+    async def test_exception_reported_as_unhealthy(self) -> None:
+        """Test that a raising check does not fail the others."""
+
+        async def healthy() -> dict[str, Any]:
+            return {"status": "healthy"}
+
+        async def broken() -> dict[str, Any]:
+            raise ConnectionError("refused")
+
+        result = await health_check_all({"ok": healthy, "down": broken})
+
+        assert result["ok"] == {"status": "healthy"}
+        assert result["down"]["status"] == "unhealthy"
+        assert "refused" in result["down"]["error"]
+
+
+class TestWarmUpAll:
+    """Tests for warm_up_all."""
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_block_other_warmers(self) -> None:
+        """Test that a failing store is skipped without raising."""
+        warmed: list[str] = []
+
+        async def healthy() -> None:
+            warmed.append("healthy")
+
+        async def broken() -> None:
+            raise ConnectionError("refused")
+
+        await warm_up_all({"down": broken, "up": healthy})
+
+        assert warmed == ["healthy"]
+
+
+class TestPostgresWarmUp:
+    """Tests for PostgresClient.warm_up."""
+
+    @pytest.mark.asyncio
+    async def test_opens_a_small_fixed_number_of_connections(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that startup does not fill the whole pool."""
+        opened = 0
+
+        class FakeConnection:
+            async def execute(self, statement: Any) -> None:
+                pass
+
+        class FakeEngine:
+            @asynccontextmanager
+            async def connect(self) -> Any:
+                nonlocal opened
+                opened += 1
+                yield FakeConnection()
+
+        monkeypatch.setattr(PostgresClient, "get_engine", classmethod(lambda cls: FakeEngine()))
+
+        await PostgresClient.warm_up()
+        default_count = opened
+        await PostgresClient.warm_up(connections=1000)
+
+        assert default_count == 2
+        assert opened - default_count == 10
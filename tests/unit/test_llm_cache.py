@@ -0,0 +1,189 @@
+"""
+Unit tests for the LLM response cache.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from shared.llm.cache import LLMCache, MemoryCacheBackend
+from shared.llm.provider import LLMResponse, LLMUsage
+
+
+REQUEST: dict[str, Any] = {
+    "model": "test-model",
+    "messages": [{"role": "user", "content": "Hello"}],
+    "temperature": 0,
+}
+
+
+class TestCacheKey:
+    """Tests for LLMCache.key."""
+
+    def test_key_is_stable_across_dict_order(self) -> None:
+        """Test that key order in the request does not change the key."""
+        reordered = dict(reversed(list(REQUEST.items())))
+
+        assert LLMCache.key("ollama", REQUEST, 0) == LLMCache.key("ollama", reordered, 0)
+
+    def test_key_is_namespaced_by_provider(self) -> None:
+        """Test that providers never share entries."""
+        assert LLMCache.key("ollama", REQUEST, 0) != LLMCache.key("openai", REQUEST, 0)
+
+    def test_non_deterministic_request_is_not_cached(self) -> None:
+        """Test that sampling temperatures yield no key."""
+        assert LLMCache.key("ollama", REQUEST, 0.7) is None
+
+
+class TestLLMCache:
+    """Tests for LLMCache lookups."""
+
+    @pytest.mark.asyncio
+    async def test_hit_reports_zero_cost(self) -> None:
+        """Test that a cached response keeps tokens but drops cost."""
+        cache = LLMCache(MemoryCacheBackend())
+        response = LLMResponse(
+            content="Hi",
+            model="test-model",
+            provider="ollama",
+            usage=LLMUsage(prompt_tokens=3, completion_tokens=1, total_tokens=4, total_cost=0.5),
+            latency_ms=250.0,
+        )
+
+        await cache.set("k", response)
+        cached = await cache.get("k")
+
+        assert cached is not None
+        assert cached.content == "Hi"
+        assert cached.usage.total_tokens == 4
+        assert cached.usage.total_cost == 0.0
+        assert cached.latency_ms < 250.0
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self) -> None:
+        """Test that an unknown key is a miss."""
+        assert await LLMCache(MemoryCacheBackend()).get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_evicts_least_recently_used(self) -> None:
+        """Test that the memory backend stays within its entry bound."""
+        backend = MemoryCacheBackend(max_entries=2)
+
+        await backend.set("a", {"v": 1}, 60)
+        await backend.set("b", {"v": 2}, 60)
+        await backend.get("a")
+        await backend.set("c", {"v": 3}, 60)
+
+        assert await backend.get("a") == {"v": 1}
+        assert await backend.get("b") is None
+        assert await backend.get("c") == {"v": 3}
+
+
+class TestGetOrCreate:
+    """Tests for request coalescing in LLMCache.get_or_create."""
+
+    @staticmethod
+    def _response(content: str) -> LLMResponse:
+        return LLMResponse(
+            content=content,
+            model="test-model",
+            provider="ollama",
+            usage=LLMUsage(total_tokens=4, total_cost=0.5),
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_request(self) -> None:
+        """Test that identical in-flight requests collapse into one call."""
+        cache = LLMCache(MemoryCacheBackend())
+        calls = 0
+
+        async def create() -> LLMResponse:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return self._response("Hi")
+
+        responses = await asyncio.gather(*(cache.get_or_create("k", create) for _ in range(5)))
+
+        assert calls == 1
+        assert [r.content for r in responses] == ["Hi"] * 5
+        # Only the caller that made the request pays for it
+        assert sorted(r.usage.total_cost for r in responses) == [0.0] * 4 + [0.5]
+
+    @pytest.mark.asyncio
+    async def test_result_is_stored(self) -> None:
+        """Test that later callers are served from the store."""
+        cache = LLMCache(MemoryCacheBackend())
+
+        await cache.get_or_create("k", lambda: asyncio.sleep(0, self._response("Hi")))
+        cached = await cache.get("k")
+
+        assert cached is not None
+        assert cached.content == "Hi"
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_callers(self) -> None:
+        """Test that a failed request fails every waiter and is not stored."""
+        cache = LLMCache(MemoryCacheBackend())
+
+        async def create() -> LLMResponse:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(cache.get_or_create("k", create) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_waiters(self) -> None:
+        """Test that cancelling the caller that started a request leaves it running for the rest."""
+        cache = LLMCache(MemoryCacheBackend())
+
+        async def create() -> LLMResponse:
+            await asyncio.sleep(0.05)
+            return self._response("Hi")
+
+        leader = asyncio.create_task(cache.get_or_create("k", create))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_create("k", create)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        responses = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert [r.content for r in responses] == ["Hi"] * 3
+
+    @pytest.mark.asyncio
+    async def test_request_stays_in_flight_until_stored(self) -> None:
+        """Test that a caller arriving while the result is being stored does not repeat the request."""
+        backend = MemoryCacheBackend()
+        cache = LLMCache(backend)
+        calls = 0
+        storing = asyncio.Event()
+        backend_set = backend.set
+
+        async def slow_set(*args: object, **kwargs: object) -> None:
+            storing.set()
+            await asyncio.sleep(0.05)
+            await backend_set(*args, **kwargs)
+
+        backend.set = slow_set
+
+        async def create() -> LLMResponse:
+            nonlocal calls
+            calls += 1
+            return self._response("Hi")
+
+        first = asyncio.create_task(cache.get_or_create("k", create))
+        await storing.wait()
+        second = await cache.get_or_create("k", create)
+
+        assert (await first).content == "Hi"
+        assert second.content == "Hi"
+        assert calls == 1
@@ -0,0 +1,74 @@
+"""
+Unit tests for the shared LLM HTTP clients.
+"""
+
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+from structlog.testing import capture_logs
+
+from shared.llm import http
+
+
+TIMEOUT = httpx.Timeout(5.0)
+
+
+@pytest.fixture(autouse=True)
+async def _reset_clients() -> AsyncIterator[None]:
+    """Start and end every test without shared clients."""
+    await http.close_clients()
+    yield
+    await http.close_clients()
+
+
+class TestSharedClients:
+    """Tests for get_client/release_client reference counting."""
+
+    @pytest.mark.asyncio
+    async def test_closed_only_after_last_release(self) -> None:
+        """Test that a client stays open while any holder remains."""
+        first = http.get_client("http://llm", TIMEOUT)
+        second = http.get_client("http://llm", TIMEOUT)
+
+        await http.release_client(first)
+        assert second is first
+        assert not first.is_closed
+
+        await http.release_client(second)
+        assert first.is_closed
+
+    @pytest.mark.asyncio
+    async def test_stale_release_does_not_close_replacement(self) -> None:
+        """Test that releasing a replaced client leaves its successor open."""
+        old = http.get_client("http://llm", TIMEOUT)
+        await old.aclose()
+        new = http.get_client("http://llm", TIMEOUT)
+
+        await http.release_client(old)
+
+        assert new is not old
+        assert not new.is_closed
+        assert http.get_client("http://llm", TIMEOUT) is new
+
+    @pytest.mark.asyncio
+    async def test_release_after_close_clients_is_harmless(self) -> None:
+        """Test that holders releasing after shutdown do not affect new clients."""
+        old = http.get_client("http://llm", TIMEOUT)
+        await http.close_clients()
+        new = http.get_client("http://llm", TIMEOUT)
+
+        await http.release_client(old)
+
+        assert old.is_closed
+        assert not new.is_closed
+
+    def test_conflicting_options_are_reported(self) -> None:
+        """Test that a later caller's ignored options are logged."""
+        http.get_client("http://llm", TIMEOUT)
+
+        with capture_logs() as logs:
+            http.get_client("http://llm", httpx.Timeout(60.0), http2=True)
+
+        assert logs[0]["event"] == "http_client_options_ignored"
+        assert logs[0]["differing"] == ["http2", "timeout"]
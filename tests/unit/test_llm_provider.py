@@ -0,0 +1,160 @@
+"""
+Unit tests for the LLM provider base class.
+"""
+
+import asyncio
+import gc
+from typing import Any
+
+import pytest
+
+from shared.llm import provider as provider_module
+from shared.llm.http import close_clients
+from shared.llm.ollama import OllamaProvider
+from shared.llm.provider import (
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+    close_llm_provider,
+    set_llm_provider,
+)
+
+
+class EchoProvider(LLMProvider):
+    """Provider that echoes the last message after a short delay."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        self._max_concurrency = max_concurrency
+        self.running = 0
+        self.peak = 0
+
+    @property
+    def name(self) -> str:
+        return "echo"
+
+    @property
+    def model(self) -> str:
+        return "echo-1"
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    async def complete(
+        self,
+        messages: list[LLMMessage],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+    ) -> LLMResponse:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        # Later prompts finish first, so ordering is not completion order
+        await asyncio.sleep(0.01 / len(messages[-1].content))
+        self.running -= 1
+        return LLMResponse(content=messages[-1].content, model=self.model, provider=self.name)
+
+    async def health_check(self) -> dict[str, Any]:
+        return {"status": "healthy"}
+
+
+class FailingProvider(EchoProvider):
+    """Provider that fails "boom" prompts and is slow on the rest."""
+
+    async def complete(
+        self,
+        messages: list[LLMMessage],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop_sequences: list[str] | None = None,
+    ) -> LLMResponse:
+        self.running += 1
+        try:
+            if messages[-1].content == "boom":
+                await asyncio.sleep(0.01)
+                raise RuntimeError("boom")
+            await asyncio.sleep(1)
+            return LLMResponse(content=messages[-1].content, model=self.model, provider=self.name)
+        finally:
+            self.running -= 1
+
+
+class TestBatchComplete:
+    """Tests for LLMProvider.batch_complete."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_input_order(self) -> None:
+        """Test that responses line up with their prompts."""
+        provider = EchoProvider(max_concurrency=4)
+        prompts = ["x" * n for n in range(1, 11)]
+
+        responses = await provider.batch_complete(
+            [[LLMMessage(role="user", content=p)] for p in prompts]
+        )
+
+        assert [r.content for r in responses] == prompts
+
+    @pytest.mark.asyncio
+    async def test_bounds_in_flight_requests(self) -> None:
+        """Test that no more than max_concurrency requests run at once."""
+        provider = EchoProvider(max_concurrency=3)
+
+        await provider.batch_complete([[LLMMessage(role="user", content="x")] for _ in range(10)])
+
+        assert provider.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_and_collects_requests(self) -> None:
+        """Test that a failure stops the other requests and leaves no task unretrieved."""
+        provider = FailingProvider(max_concurrency=4)
+        loop = asyncio.get_running_loop()
+        unhandled: list[dict[str, Any]] = []
+        loop.set_exception_handler(lambda _, context: unhandled.append(context))
+        try:
+            with pytest.raises(RuntimeError, match="boom") as excinfo:
+                await provider.batch_complete(
+                    [[LLMMessage(role="user", content=p)] for p in ("boom", "boom", "x", "y")]
+                )
+            # The traceback keeps the finished tasks alive
+            del excinfo
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert provider.running == 0
+        assert unhandled == []
+
+
+class TestCloseLLMProvider:
+    """Tests for provider shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_closes_and_resets_provider(self) -> None:
+        """Test that the configured provider is closed and rebuilt on next access."""
+        provider = EchoProvider(max_concurrency=1)
+        closed = []
+
+        async def close() -> None:
+            closed.append(True)
+
+        provider.close = close  # type: ignore[method-assign]
+        set_llm_provider(provider)
+
+        await close_llm_provider()
+        await close_llm_provider()
+
+        assert closed == [True]
+        assert provider_module._provider is None
+
+    @pytest.mark.asyncio
+    async def test_ollama_keepalive_stops_with_its_client(self) -> None:
+        """Test that the keepalive loop exits once the shared client is closed."""
+        provider = OllamaProvider()
+        provider.start_keepalive(interval=0.01)
+        task = provider._keepalive_task
+        assert task is not None
+
+        await close_clients()
+        await asyncio.wait_for(task, 1)
+
+        assert task.exception() is None
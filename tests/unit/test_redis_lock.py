@@ -0,0 +1,73 @@
+"""
+Unit tests for the Redis distributed lock.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from shared.database import redis as redis_module
+from shared.database.redis import RedisClient, redis_lock
+
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """In-memory Redis installed as the shared client."""
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(RedisClient, "_client", client)
+    monkeypatch.setattr(RedisClient, "_unlock_script", None)
+    monkeypatch.setattr(RedisClient, "_lock_wait_slots", None)
+    return client
+
+
+class TestRedisLock:
+    """Tests for redis_lock."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_do_not_exhaust_the_pool(self, fake_redis: Any) -> None:
+        """Test that many blocked waiters park only a bounded number of connections."""
+        blocked = 0
+        peak = 0
+        blpop = fake_redis.blpop
+
+        async def counting_blpop(*args: Any, **kwargs: Any) -> Any:
+            nonlocal blocked, peak
+            blocked += 1
+            peak = max(peak, blocked)
+            try:
+                return await blpop(*args, **kwargs)
+            finally:
+                blocked -= 1
+
+        fake_redis.blpop = counting_blpop
+
+        async def waiter() -> bool:
+            async with redis_lock("resource", timeout_seconds=5) as acquired:
+                return acquired
+
+        async with redis_lock("resource", timeout_seconds=5) as held:
+            assert held
+            waiters = [asyncio.create_task(waiter()) for _ in range(30)]
+            await asyncio.sleep(0.2)
+
+            # Other Redis traffic still gets a connection
+            assert await fake_redis.ping()
+
+        results = await asyncio.gather(*waiters)
+
+        assert all(results)
+        assert 0 < peak <= redis_module._MAX_LOCK_WAITERS
+
+    @pytest.mark.asyncio
+    async def test_non_blocking_returns_immediately(self, fake_redis: Any) -> None:
+        """Test that a non-blocking attempt on a held lock fails without waiting."""
+        async with (
+            redis_lock("resource") as held,
+            redis_lock("resource", blocking=False) as acquired,
+        ):
+            assert held
+            assert acquired is False
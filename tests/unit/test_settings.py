@@ -0,0 +1,86 @@
+"""
+Unit tests for configuration settings.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from shared.config.settings import (
+    BlockchainMode,
+    BlockchainSettings,
+    CORSSettings,
+    KafkaSettings,
+    PostgresSettings,
+)
+
+
+class TestCSVListParsing:
+    """Tests for comma-separated list settings."""
+
+    def test_cors_origins_default(self) -> None:
+        """Test default CORS origins are a parsed list."""
+        cors = CORSSettings()
+
+        assert cors.origins_list == ["http://localhost:3000", "http://localhost:5173"]
+
+    def test_cors_origins_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test comma-separated env value is split and stripped."""
+        monkeypatch.setenv("CORS_ORIGINS", "https://a.example, https://b.example,,")
+        cors = CORSSettings()
+
+        assert cors.origins == ["https://a.example", "https://b.example"]
+        assert cors.origins_list is cors.origins
+
+    def test_kafka_bootstrap_servers_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test Kafka bootstrap servers accept a comma-separated list."""
+        monkeypatch.setenv("KAFKA_BOOTSTRAP_SERVERS", "kafka-1:9092,kafka-2:9092")
+        kafka = KafkaSettings()
+
+        assert kafka.bootstrap_servers == ["kafka-1:9092", "kafka-2:9092"]
+
+
+class TestFrozenSettings:
+    """Tests for read-only settings models."""
+
+    def test_settings_are_frozen(self) -> None:
+        """Test that assigning to a loaded setting raises."""
+        cors = CORSSettings()
+
+        with pytest.raises(ValidationError):
+            cors.allow_credentials = False
+
+
+class TestBlockchainRpcUrl:
+    """Tests for the resolved blockchain RPC URL."""
+
+    def test_mock_mode_has_no_rpc_url(self) -> None:
+        """Test mock mode resolves to an empty URL."""
+        blockchain = BlockchainSettings(mode=BlockchainMode.MOCK)
+
+        assert blockchain.rpc_url == ""
+
+    def test_testnet_rpc_url_includes_key(self) -> None:
+        """Test testnet URL is built from the Alchemy key."""
+        blockchain = BlockchainSettings(mode=BlockchainMode.TESTNET, alchemy_api_key="abc")
+
+        assert blockchain.rpc_url == "https://polygon-mumbai.g.alchemy.com/v2/abc"
+
+    def test_mainnet_rpc_url_includes_key(self) -> None:
+        """Test mainnet URL is built from the Alchemy key."""
+        blockchain = BlockchainSettings(mode=BlockchainMode.MAINNET, alchemy_api_key="abc")
+
+        assert blockchain.rpc_url == "https://polygon-mainnet.g.alchemy.com/v2/abc"
+
+
+class TestSecretDerivedUrls:
+    """Tests for lazily resolved, secret-derived connection URLs."""
+
+    def test_url_resolved_once(self) -> None:
+        """Test the URL is memoized on first access."""
+        postgres = PostgresSettings(password="pw")
+
+        assert "async_url" not in postgres.__dict__
+        url = postgres.async_url
+
+        assert url == "postgresql+asyncpg://civium:pw@localhost:5432/civium"
+        assert postgres.__dict__["async_url"] is url
@@ -7,6 +7,10 @@ Tests for the Python ZK proof generation and verification.
 Version: 1.0.0
 """
 
+import asyncio
+import json
+from pathlib import Path
+
 import pytest
 
 from shared.zk.models import (
@@ -246,6 +250,159 @@ class TestComplianceProver:
                 entity_id="LEI-123",
             )
 
+    @pytest.mark.asyncio
+    async def test_cancelled_command_is_reaped(self, tmp_path, monkeypatch):
+        """Test that cancelling a proof kills its subprocess and waits for it to exit."""
+        prover = ComplianceProver.__new__(ComplianceProver)
+        prover.build_dir = tmp_path / "build"
+        processes = []
+        create_subprocess_exec = asyncio.create_subprocess_exec
+
+        async def recording_exec(*args, **kwargs):
+            process = await create_subprocess_exec(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", recording_exec)
+
+        task = asyncio.create_task(prover._run_command(["sleep", "10"], "compliance_threshold"))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert processes[0].returncode is not None
+
+
+class FakeStageProver(ComplianceProver):
+    """Prover whose snarkjs/rapidsnark commands are simulated with a delay."""
+
+    def __init__(self, build_dir: Path) -> None:
+        for name in ("compliance_threshold", "range_proof", "tier_membership"):
+            circuit_dir = build_dir / name
+            (circuit_dir / f"{name}_js").mkdir(parents=True)
+            (circuit_dir / f"{name}_js" / f"{name}.wasm").write_bytes(b"")
+            (circuit_dir / "proving_key.zkey").write_bytes(b"")
+        super().__init__(build_dir, rapidsnark_path="rapidsnark")
+        self.running = {"solve": 0, "prove": 0}
+        self.overlapped = False
+        self.commands = 0
+
+    async def _run_command(self, command: list[str], circuit_name: str) -> None:
+        self.commands += 1
+        stage = "solve" if "wtns" in command else "prove"
+        if stage == "solve":
+            input_file = next(Path(arg) for arg in command if arg.endswith("input.json"))
+            if json.loads(input_file.read_text()).get("fail"):
+                raise RuntimeError("Proof generation failed: constraint failed")
+        self.running[stage] += 1
+        self.overlapped |= all(self.running.values())
+        await asyncio.sleep(0.01)
+        self.running[stage] -= 1
+
+        if stage == "prove":
+            proof_file, public_file = Path(command[-2]), Path(command[-1])
+            score = json.loads((proof_file.parent / "input.json").read_text())["score"]
+            proof_file.write_text(
+                json.dumps(
+                    {"pi_a": ["1", "2"], "pi_b": [["1", "2"], ["3", "4"]], "pi_c": ["5", "6"]}
+                )
+            )
+            public_file.write_text(json.dumps([str(score)]))
+
+
+class TestProveMany:
+    """Tests for pipelined batch proving."""
+
+    @pytest.mark.asyncio
+    async def test_results_follow_job_order(self, tmp_path):
+        """Test that each result belongs to the job at the same index."""
+        prover = FakeStageProver(tmp_path)
+
+        results = await prover.prove_many(
+            [("compliance_threshold", {"score": score}) for score in range(6)],
+            max_concurrency=2,
+        )
+
+        assert [public_signals for _, public_signals, _ in results] == [
+            [str(score)] for score in range(6)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stages_overlap(self, tmp_path):
+        """Test that one job is solved while another is being proved."""
+        prover = FakeStageProver(tmp_path)
+
+        await prover.prove_many(
+            [("compliance_threshold", {"score": score}) for score in range(4)],
+            max_concurrency=1,
+        )
+
+        assert prover.overlapped
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_jobs(self, tmp_path):
+        """Test that a failing job stops the jobs that have not finished."""
+        prover = FakeStageProver(tmp_path)
+
+        with pytest.raises(RuntimeError, match="constraint failed"):
+            await prover.prove_many(
+                [("compliance_threshold", {"fail": True})]
+                + [("compliance_threshold", {"score": score}) for score in range(4)],
+                max_concurrency=1,
+            )
+        await asyncio.sleep(0.1)
+
+        # The next job may start before the failure is seen, but no further
+        assert prover.commands <= 2
+
+    @pytest.mark.asyncio
+    async def test_prove_batch_mixes_proof_types(self, tmp_path):
+        """Test that a mixed batch returns typed proofs in request order."""
+        prover = FakeStageProver(tmp_path)
+
+        proofs = await prover.prove_batch(
+            [
+                ThresholdProofRequest(entity_id="LEI-1", score=8500, threshold=8000),
+                RangeProofRequest(entity_id="LEI-2", score=8000, min_score=7000, max_score=9000),
+                TierProofRequest(entity_id="LEI-3", score=9700, tier=1),
+            ]
+        )
+
+        assert [p.metadata.circuit_name for p in proofs] == [
+            "compliance_threshold",
+            "range_proof",
+            "tier_membership",
+        ]
+        assert [p.public_signals.signals for p in proofs] == [["8500"], ["8000"], ["9700"]]
+        assert proofs[2].metadata.tier == 1
+
+
+class TestProofCache:
+    """Tests for reusing proofs of caller-salted jobs."""
+
+    @pytest.mark.asyncio
+    async def test_salted_proof_is_reused(self, tmp_path):
+        """Test that an identical salted call skips proof generation."""
+        prover = FakeStageProver(tmp_path)
+
+        first = await prover.prove_threshold(8500, 8000, "LEI-1", salt="42")
+        second = await prover.prove_threshold(8500, 8000, "LEI-1", salt="42")
+
+        assert prover.commands == 2
+        assert second == first
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_unsalted_proof_is_always_generated(self, tmp_path):
+        """Test that calls with a generated salt are never served from the cache."""
+        prover = FakeStageProver(tmp_path)
+
+        await prover.prove_threshold(8500, 8000, "LEI-1")
+        await prover.prove_threshold(8500, 8000, "LEI-1")
+
+        assert prover.commands == 4
+
 
 class TestThresholdInput:
     """Tests for ThresholdInput dataclass."""
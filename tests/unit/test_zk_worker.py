@@ -0,0 +1,164 @@
+"""
+Unit tests for the long-lived snarkjs worker.
+
+A stub snarkjs module stands in for the real package, so only Node.js is
+required.
+"""
+
+import asyncio
+import shutil
+from pathlib import Path
+
+import pytest
+
+from shared.zk import worker as worker_module
+from shared.zk.worker import SnarkjsWorker
+
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="Node.js not installed")
+
+FAKE_SNARKJS = """
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+module.exports = {
+    groth16: {
+        async fullProve(input, wasm, zkey) {
+            await sleep(input.delay || 0);
+            if (input.chatter) {
+                console.log("snarkjs progress");
+                process.stdout.write("plain text\\n42\\n");
+            }
+            if (input.flood) process.stdout.write("x".repeat(input.flood) + "\\n");
+            if (input.fail) throw new Error("constraint failed");
+            return { proof: { wasm, zkey }, publicSignals: [String(input.x)] };
+        },
+        async verify(vkey, publicSignals, proof) {
+            return vkey.ok && publicSignals.length === 1;
+        },
+    },
+};
+"""
+
+
+@pytest.fixture
+def worker_dir(tmp_path: Path) -> Path:
+    """Directory whose node_modules provide the stub snarkjs."""
+    package = tmp_path / "node_modules" / "snarkjs"
+    package.mkdir(parents=True)
+    (package / "index.js").write_text(FAKE_SNARKJS)
+    (tmp_path / "vkey.json").write_text('{"ok": true}')
+    return tmp_path
+
+
+class TestSnarkjsWorker:
+    """Tests for SnarkjsWorker requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_process(self, worker_dir: Path) -> None:
+        """Test that replies reach their callers even when they arrive out of order."""
+        worker = SnarkjsWorker(worker_dir)
+        try:
+            results = await asyncio.gather(
+                *(
+                    worker.request(
+                        "prove", wasm="c.wasm", zkey="c.zkey", input={"x": x, "delay": 50 - 10 * x}
+                    )
+                    for x in range(5)
+                )
+            )
+            pid = worker._process.pid
+
+            valid = await worker.request(
+                "verify", vkey=str(worker_dir / "vkey.json"), publicSignals=["1"], proof={}
+            )
+            assert worker._process.pid == pid
+        finally:
+            await worker.close()
+
+        assert [r["publicSignals"] for r in results] == [[str(x)] for x in range(5)]
+        assert results[0]["proof"] == {"wasm": "c.wasm", "zkey": "c.zkey"}
+        assert valid is True
+
+    @pytest.mark.asyncio
+    async def test_failure_is_raised_to_its_caller_only(self, worker_dir: Path) -> None:
+        """Test that a failing request does not affect the others."""
+        worker = SnarkjsWorker(worker_dir)
+        try:
+            results = await asyncio.gather(
+                worker.request("prove", wasm="c.wasm", zkey="c.zkey", input={"fail": True}),
+                worker.request("prove", wasm="c.wasm", zkey="c.zkey", input={"x": 1}),
+                return_exceptions=True,
+            )
+        finally:
+            await worker.close()
+
+        assert isinstance(results[0], RuntimeError)
+        assert "constraint failed" in str(results[0])
+        assert results[1]["publicSignals"] == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_restarts_after_exit(self, worker_dir: Path) -> None:
+        """Test that a worker that died is started again on the next request."""
+        worker = SnarkjsWorker(worker_dir)
+        try:
+            await worker.request("prove", wasm="c.wasm", zkey="c.zkey", input={"x": 1})
+            worker._process.kill()
+            await worker._process.wait()
+
+            result = await worker.request("prove", wasm="c.wasm", zkey="c.zkey", input={"x": 2})
+        finally:
+            await worker.close()
+
+        assert result["publicSignals"] == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_stray_stdout_is_skipped(self, worker_dir: Path) -> None:
+        """Test that logging and non-reply lines on stdout do not break the worker."""
+        worker = SnarkjsWorker(worker_dir)
+        try:
+            result = await asyncio.wait_for(
+                worker.request(
+                    "prove", wasm="c.wasm", zkey="c.zkey", input={"x": 1, "chatter": True}
+                ),
+                5,
+            )
+            after = await asyncio.wait_for(
+                worker.request("prove", wasm="c.wasm", zkey="c.zkey", input={"x": 2}), 5
+            )
+        finally:
+            await worker.close()
+
+        assert result["publicSignals"] == ["1"]
+        assert after["publicSignals"] == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_request_times_out(self, worker_dir: Path) -> None:
+        """Test that a request without a reply fails instead of hanging."""
+        worker = SnarkjsWorker(worker_dir, request_timeout=0.05)
+        try:
+            with pytest.raises(RuntimeError, match="did not reply"):
+                await worker.request("prove", wasm="c.wasm", zkey="c.zkey", input={"delay": 1000})
+        finally:
+            await worker.close()
+
+    @pytest.mark.asyncio
+    async def test_unreadable_output_fails_requests_and_restarts(
+        self, worker_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a reader failure fails pending requests rather than hanging them."""
+        monkeypatch.setattr(worker_module, "_MAX_LINE_BYTES", 1024)
+        worker = SnarkjsWorker(worker_dir)
+        try:
+            with pytest.raises(RuntimeError, match="exited"):
+                await asyncio.wait_for(
+                    worker.request(
+                        "prove", wasm="c.wasm", zkey="c.zkey", input={"x": 1, "flood": 4096}
+                    ),
+                    5,
+                )
+            result = await asyncio.wait_for(
+                worker.request("prove", wasm="c.wasm", zkey="c.zkey", input={"x": 2}), 5
+            )
+        finally:
+            await worker.close()
+
+        assert result["publicSignals"] == ["2"]